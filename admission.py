@@ -0,0 +1,250 @@
+"""Admission Control and Priority Lanes for News Sentiment Analysis Project."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator
+
+from metrics import Histogram
+
+DEFAULT_LANES = {
+    "interactive": {"priority": 0, "max_queue": 16, "max_wait": 10.0},
+    "audio": {"priority": 1, "max_queue": 8, "max_wait": 20.0},
+    "bulk": {"priority": 2, "max_queue": 4, "max_wait": 30.0},
+}
+
+
+class Overloaded(Exception):
+    """
+    Raised when a request cannot be admitted in time.
+    """
+    def __init__(self, lane: str, status_code: int, retry_after: int, reason: str):
+        """
+        Describe the rejection.
+
+        Args:
+            lane (str): Workload class that rejected the request.
+            status_code (int): 429 when the queue is full, 503 on wait timeout.
+            retry_after (int): Suggested client back-off, in seconds.
+            reason (str): Human-readable explanation.
+        """
+        super().__init__(reason)
+        self.lane = lane
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Bounded, prioritized admission in front of model inference.
+
+    A fixed number of inference slots is shared by all workload classes.
+    Requests that cannot start immediately wait in their lane's bounded
+    queue; freed slots always go to the highest-priority lane first.
+    Lower-priority lanes together may hold at most `max_concurrency -
+    reserved_slots` slots, so long-running audio or bulk work can never
+    occupy the slots interactive requests need.
+    """
+    def __init__(
+        self,
+        max_concurrency: int = 2,
+        lanes: Dict[str, Dict[str, Any]] = None,
+        reserved_slots: int = 1
+    ):
+        """
+        Configure slots and lanes.
+
+        Args:
+            max_concurrency (int): Number of requests allowed to run inference at once.
+            lanes (dict): Per-lane priority (lower runs first), max_queue and
+                max_wait (seconds).
+            reserved_slots (int): Slots only the highest-priority lane may
+                use (at most max_concurrency - 1).
+        """
+        self.max_concurrency = max_concurrency
+        self.lanes = lanes or DEFAULT_LANES
+        self.priority_order = sorted(self.lanes, key=lambda lane: self.lanes[lane]["priority"])
+        self.top_lane = self.priority_order[0]
+        self.shared_limit = max_concurrency - min(reserved_slots, max_concurrency - 1)
+        self.active = 0
+        self.shared_active = 0
+        self.waiters = {lane: deque() for lane in self.lanes}
+        self.wait_times = {lane: Histogram() for lane in self.lanes}
+        self.counters = {
+            lane: {"admitted": 0, "rejected_queue_full": 0, "rejected_timeout": 0}
+            for lane in self.lanes
+        }
+        self.cached_served = 0
+        self.service_time = 1.0
+
+    def record_cached(self) -> None:
+        """
+        Count a request served from cache without needing a slot.
+        """
+        self.cached_served += 1
+
+    def _retry_after(self, lane: str) -> int:
+        """
+        Estimate how long a rejected client should wait.
+
+        Args:
+            lane (str): Lane the request was rejected from.
+
+        Returns:
+            int: Seconds until a retry is likely to be admitted.
+        """
+        ahead = sum(
+            len(self.waiters[other]) for other in self.priority_order
+            if self.lanes[other]["priority"] <= self.lanes[lane]["priority"]
+        )
+        return max(1, math.ceil((ahead + 1) * self.service_time / self.max_concurrency))
+
+    def _can_start(self, lane: str) -> bool:
+        """
+        Check whether a slot is free for the given lane.
+
+        Args:
+            lane (str): Workload class.
+
+        Returns:
+            bool: True if the lane may take a slot now.
+        """
+        if self.active >= self.max_concurrency:
+            return False
+        return lane == self.top_lane or self.shared_active < self.shared_limit
+
+    def _take(self, lane: str) -> None:
+        """
+        Account for a slot taken by the given lane.
+
+        Args:
+            lane (str): Workload class.
+        """
+        self.active += 1
+        if lane != self.top_lane:
+            self.shared_active += 1
+
+    def _has_priority_waiters(self, lane: str) -> bool:
+        """
+        Check whether an equal or higher priority request is already queued.
+
+        Args:
+            lane (str): Lane of the arriving request.
+
+        Returns:
+            bool: True if the arriving request must queue behind others.
+        """
+        priority = self.lanes[lane]["priority"]
+        return any(
+            self.waiters[other] for other in self.priority_order
+            if self.lanes[other]["priority"] <= priority
+        )
+
+    async def _acquire(self, lane: str) -> None:
+        """
+        Wait for an inference slot in the given lane.
+
+        Args:
+            lane (str): Workload class.
+
+        Raises:
+            Overloaded: If the lane queue is full or the wait times out.
+        """
+        started = time.monotonic()
+        if self._can_start(lane) and not self._has_priority_waiters(lane):
+            self._take(lane)
+        else:
+            queue = self.waiters[lane]
+            if len(queue) >= self.lanes[lane]["max_queue"]:
+                self.counters[lane]["rejected_queue_full"] += 1
+                raise Overloaded(
+                    lane, 429, self._retry_after(lane), f"{lane} queue is full"
+                )
+
+            waiter = asyncio.get_running_loop().create_future()
+            queue.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout=self.lanes[lane]["max_wait"])
+            except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                if waiter in queue:
+                    queue.remove(waiter)
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was handed over just as we gave up; pass it on.
+                    self._release(lane)
+                if isinstance(e, asyncio.TimeoutError):
+                    self.counters[lane]["rejected_timeout"] += 1
+                    raise Overloaded(
+                        lane, 503, self._retry_after(lane),
+                        f"Timed out waiting for a {lane} slot"
+                    )
+                raise
+
+        self.counters[lane]["admitted"] += 1
+        self.wait_times[lane].observe((time.monotonic() - started) * 1000)
+
+    def _release(self, lane: str) -> None:
+        """
+        Hand freed capacity to the highest-priority eligible waiter.
+
+        Args:
+            lane (str): Lane that held the freed slot.
+        """
+        self.active -= 1
+        if lane != self.top_lane:
+            self.shared_active -= 1
+        for waiting_lane in self.priority_order:
+            if not self._can_start(waiting_lane):
+                continue
+            queue = self.waiters[waiting_lane]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    self._take(waiting_lane)
+                    waiter.set_result(None)
+                    return
+
+    @asynccontextmanager
+    async def slot(self, lane: str) -> AsyncIterator[None]:
+        """
+        Hold an inference slot for the duration of the block.
+
+        Args:
+            lane (str): Workload class (see DEFAULT_LANES).
+
+        Raises:
+            Overloaded: If the request cannot be admitted.
+        """
+        await self._acquire(lane)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            self.service_time = 0.8 * self.service_time + 0.2 * elapsed
+            self._release(lane)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Summarize queue depths, outcomes and wait times.
+
+        Returns:
+            dict: Global and per-lane admission metrics.
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "shared_limit": self.shared_limit,
+            "in_flight": self.active,
+            "shared_in_flight": self.shared_active,
+            "cached_served": self.cached_served,
+            "mean_service_seconds": round(self.service_time, 3),
+            "lanes": {
+                lane: {
+                    "queue_depth": len(self.waiters[lane]),
+                    **self.counters[lane],
+                    "wait_ms": self.wait_times[lane].snapshot()
+                }
+                for lane in self.priority_order
+            }
+        }
@@ -1,12 +1,49 @@
 """API Module for News Sentiment Analysis Project."""
 
-from typing import List, Dict, Any
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Query, HTTPException
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
 
+from admission import AdmissionController, Overloaded
+from comparison import TopicOverlapEngine
+from deadline import Deadline
+from feed_fetcher import ConditionalFeedFetcher
+from history_store import BUCKETS, SentimentHistoryStore, parse_published
+from jobs import JobManager
+from live_sentiment import LiveSentimentTracker
+from prefetch import PrefetchScheduler
 from utils import sentiment_utils
 from news_extractor import fetch_news
 
+HISTORY_DIR = os.environ.get("HISTORY_DIR", "data/history")
+NEWS_CACHE_TTL = float(os.environ.get("NEWS_CACHE_TTL", "900"))
+PREFETCH_TOP_N = int(os.environ.get("PREFETCH_TOP_N", "10"))
+ADMISSION_MAX_CONCURRENCY = int(os.environ.get("ADMISSION_MAX_CONCURRENCY", "2"))
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+JOB_RESULT_TTL = float(os.environ.get("JOB_RESULT_TTL", "900"))
+COMPARISON_TOP_K = int(os.environ.get("COMPARISON_TOP_K", "10"))
+NEWS_FEED_URL = os.environ.get(
+    "NEWS_FEED_URL", "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+)
+FEED_HOST_CONCURRENCY = int(os.environ.get("FEED_HOST_CONCURRENCY", "4"))
+
+
+class JobRequest(BaseModel):
+    """
+    Request body for POST /jobs.
+    """
+    type: str = Field(..., description="Job type: 'report' or 'audio'")
+    company: Optional[str] = Field(None, description="Company name (report jobs)")
+    text: Optional[str] = Field(None, description="Text to voice (audio jobs)")
+    source_lang: str = Field("en", description="Source language (audio jobs)")
+    target_lang: str = Field("hi", description="Target language (audio jobs)")
+
+
 class NewsAnalysisAPI:
     """
     API Router for News Sentiment Analysis endpoints.
@@ -17,6 +54,26 @@ class NewsAnalysisAPI:
         """
         self.router = APIRouter()
         self.news_cache = {}
+        self.inflight_reports = {}
+        self.inflight_articles = {}
+        self.last_embedding_usage = {}
+        self.history_store = SentimentHistoryStore(HISTORY_DIR)
+        self.live_sentiment = LiveSentimentTracker(history=self._stored_scores)
+        self.topic_overlap = TopicOverlapEngine(COMPARISON_TOP_K)
+        self.feed_fetcher = ConditionalFeedFetcher(
+            NEWS_FEED_URL,
+            fallback=lambda company: fetch_news(company),
+            per_host_limit=FEED_HOST_CONCURRENCY
+        )
+        self.admission = AdmissionController(ADMISSION_MAX_CONCURRENCY)
+        self.jobs = JobManager(
+            {"report": self._run_report_job, "audio": self._run_audio_job},
+            workers=JOB_WORKERS,
+            result_ttl=JOB_RESULT_TTL
+        )
+        self.prefetcher = PrefetchScheduler(
+            self._prefetch_report, self._cache_expiry, top_n=PREFETCH_TOP_N
+        )
         self.setup_routes()
 
     def setup_routes(self):
@@ -25,38 +82,40 @@ class NewsAnalysisAPI:
         """
         @self.router.get("/news", response_model=Dict[str, Any])
         async def get_company_news(
-            company: str = Query(..., description="Company name for news analysis")
+            company: str = Query(..., description="Company name for news analysis"),
+            budget_ms: Optional[int] = Query(
+                None, ge=1, description="Latency budget; slow stages degrade once it is spent"
+            )
         ):
             """
             Fetch and analyze news for a given company.
 
             Args:
                 company (str): Name of the company.
+                budget_ms (int): Optional latency budget in milliseconds.
 
             Returns:
                 dict: Comprehensive news analysis report.
             """
             try:
-                # Normalize company name
+                # Normalize company name and start the latency budget
                 company = company.strip().lower()
+                deadline = Deadline(budget_ms)
+                self.prefetcher.record_request(company)
+                self.prefetcher.start()
 
                 # Check cache first
-                if company in self.news_cache:
-                    return self.news_cache[company]
-
-                # Fetch news
-                articles = await fetch_news(company)
-
-                if not articles:
-                    return self._create_empty_result(company)
-
-                # Analyze articles
-                analysis_result = self._analyze_articles(articles, company)
+                cached = self._get_cached(company)
+                if cached is not None:
+                    self.admission.record_cached()
+                    return self._with_audio_job(cached)
 
-                # Cache result
-                self.news_cache[company] = analysis_result
-                return analysis_result
+                # Builds hold an inference slot only while analyzing
+                report = await self._build_report(company, deadline)
+                return self._with_audio_job(report)
 
+            except Overloaded as e:
+                raise self._overloaded_error(e)
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
@@ -78,55 +137,574 @@ class NewsAnalysisAPI:
                 dict: Audio generation details.
             """
             try:
-                audio_result = await sentiment_utils.generate_multilingual_audio(
-                    text, source_lang, target_lang
-                )
+                async with self.admission.slot("audio"):
+                    audio_result = await sentiment_utils.generate_multilingual_audio(
+                        text, source_lang, target_lang
+                    )
                 return audio_result
+            except Overloaded as e:
+                raise self._overloaded_error(e)
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
-    def _analyze_articles(self, articles: List[Dict], company: str) -> Dict[str, Any]:
+        @self.router.post("/jobs", response_model=Dict[str, Any], status_code=202)
+        async def create_job(request: JobRequest):
+            """
+            Enqueue report or audio generation and return immediately.
+
+            Args:
+                request (JobRequest): Job specification.
+
+            Returns:
+                dict: The queued (or identical existing) job.
+            """
+            if request.type == "report":
+                if not request.company:
+                    raise HTTPException(status_code=400, detail="report jobs require 'company'")
+                params = {"company": request.company.strip().lower()}
+            elif request.type == "audio":
+                if not request.text:
+                    raise HTTPException(status_code=400, detail="audio jobs require 'text'")
+                params = {
+                    "text": request.text,
+                    "source_lang": request.source_lang,
+                    "target_lang": request.target_lang
+                }
+            else:
+                raise HTTPException(status_code=400, detail="type must be 'report' or 'audio'")
+
+            try:
+                return self.jobs.submit(request.type, params)
+            except Overloaded as e:
+                raise self._overloaded_error(e)
+
+        @self.router.get("/jobs/{job_id}", response_model=Dict[str, Any])
+        async def get_job(job_id: str):
+            """
+            Return a job's status and, once finished, its result.
+
+            Args:
+                job_id (str): Job identifier.
+
+            Returns:
+                dict: Job status, timestamps, result or error.
+            """
+            job = self.jobs.get(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Unknown or expired job: {job_id}")
+            return job
+
+        @self.router.get("/history", response_model=Dict[str, Any])
+        async def get_sentiment_history(
+            company: str = Query(..., description="Company name"),
+            from_: Optional[str] = Query(
+                None, alias="from", description="Start date/time (ISO 8601), default 30 days ago"
+            ),
+            to: Optional[str] = Query(None, description="End date/time (ISO 8601), default now"),
+            bucket: str = Query("day", description="Aggregation bucket: hour/day/week/month")
+        ):
+            """
+            Return bucketed sentiment aggregates from the history store.
+
+            Args:
+                company (str): Name of the company.
+                from_ (str): Start of the time range.
+                to (str): End of the time range.
+                bucket (str): Aggregation bucket size.
+
+            Returns:
+                dict: Time series of per-bucket sentiment aggregates.
+            """
+            if bucket not in BUCKETS:
+                raise HTTPException(
+                    status_code=400, detail=f"bucket must be one of {', '.join(BUCKETS)}"
+                )
+            try:
+                end = self._parse_time(to) if to else datetime.now(timezone.utc)
+                start = self._parse_time(from_) if from_ else end - timedelta(days=30)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            company = company.strip().lower()
+            try:
+                buckets = await asyncio.to_thread(
+                    self.history_store.query, company, start, end, bucket
+                )
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+            return {
+                "company": company,
+                "from": start.isoformat(),
+                "to": end.isoformat(),
+                "bucket": bucket,
+                "series": buckets
+            }
+
+        @self.router.get("/sentiment/live", response_model=Dict[str, Any])
+        async def get_live_sentiment(
+            company: str = Query(..., description="Company name")
+        ):
+            """
+            Return the current time-decayed sentiment of a company.
+
+            Args:
+                company (str): Name of the company.
+
+            Returns:
+                dict: Decayed mean, variance and momentum of compound scores.
+            """
+            company = company.strip().lower()
+            # The first lookup may seed the aggregate from disk
+            snapshot = await asyncio.to_thread(self.live_sentiment.snapshot, company)
+            if snapshot is None:
+                raise HTTPException(
+                    status_code=404, detail=f"No live sentiment recorded for {company}"
+                )
+            return {
+                "company": company,
+                "sentiment": sentiment_utils.classify_compound(snapshot["mean"]),
+                **snapshot
+            }
+
+        @self.router.get("/metrics", response_model=Dict[str, Any])
+        async def get_metrics():
+            """
+            Report runtime cache and pipeline statistics.
+
+            Returns:
+                dict: Metrics grouped by subsystem.
+            """
+            return {
+                "keyword_embeddings": {
+                    "lifetime": sentiment_utils.phrase_cache.get_stats(),
+                    "last_request": self.last_embedding_usage
+                },
+                "feeds": self.feed_fetcher.get_stats(),
+                "prefetch": self.prefetcher.get_stats(),
+                "admission": self.admission.get_stats(),
+                "jobs": self.jobs.get_stats(),
+                "language_routing": sentiment_utils.get_language_stats(),
+                "batching": {
+                    "summarizer": sentiment_utils.summary_batcher.get_stats(),
+                    "keyword_encoder": sentiment_utils.encoder_batcher.get_stats()
+                }
+            }
+
+    @staticmethod
+    def _overloaded_error(error: Overloaded) -> HTTPException:
+        """
+        Convert an admission rejection into an HTTP error.
+
+        Args:
+            error (Overloaded): Admission rejection.
+
+        Returns:
+            HTTPException: 429/503 response carrying Retry-After.
+        """
+        return HTTPException(
+            status_code=error.status_code,
+            detail=str(error),
+            headers={"Retry-After": str(error.retry_after)}
+        )
+
+    def _get_cached(self, company: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a company's cached report if it has not expired.
+
+        Args:
+            company (str): Normalized company name.
+
+        Returns:
+            dict: Cached analysis report, or None.
+        """
+        entry = self.news_cache.get(company)
+        if entry is None or entry["expires_at"] <= time.monotonic():
+            return None
+        return entry["result"]
+
+    def _cache_expiry(self, company: str) -> Optional[float]:
+        """
+        Return when a company's cache entry expires.
+
+        Args:
+            company (str): Normalized company name.
+
+        Returns:
+            float: time.monotonic() expiry, or None if not cached.
+        """
+        entry = self.news_cache.get(company)
+        return entry["expires_at"] if entry is not None else None
+
+    def _with_audio_job(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Attach the id of the job voicing a report's sentiment summary.
+
+        The job is enqueued (or deduplicated) right away so the audio is
+        usually ready by the time the user presses play.
+
+        Args:
+            report (dict): Analysis report.
+
+        Returns:
+            dict: Report with an `audio_job_id` field.
+        """
+        if not report["articles"]:
+            return report
+        try:
+            job = self.jobs.submit("audio", {
+                "text": report["sentiment_summary"],
+                "source_lang": "en",
+                "target_lang": "hi"
+            })
+            return {**report, "audio_job_id": job["id"]}
+        except Overloaded:
+            return {**report, "audio_job_id": None}
+
+    async def _with_retries(self, work, attempts: int = 3):
+        """
+        Run background work, waiting out admission overloads.
+
+        Args:
+            work (callable): Zero-argument coroutine function.
+            attempts (int): Admission attempts before giving up.
+
+        Returns:
+            Any: The work's result.
+        """
+        for attempt in range(attempts):
+            try:
+                return await work()
+            except Overloaded as e:
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(e.retry_after)
+
+    async def _run_audio_job(self, params: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Job handler: translate and voice text.
+
+        Args:
+            params (dict): text, source_lang and target_lang.
+
+        Returns:
+            dict: Audio generation details.
+        """
+        async def voice():
+            async with self.admission.slot("audio"):
+                return await sentiment_utils.generate_multilingual_audio(
+                    params["text"], params["source_lang"], params["target_lang"]
+                )
+
+        result = await self._with_retries(voice)
+        if not result or not result.get("audio_base64"):
+            raise RuntimeError("Audio generation failed")
+        return result
+
+    async def _run_report_job(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Job handler: build (or reuse) a company's analysis report.
+
+        Args:
+            params (dict): company.
+
+        Returns:
+            dict: Comprehensive news analysis report.
+        """
+        company = params["company"]
+        report = self._get_cached(company)
+        if report is None:
+            report = await self._with_retries(lambda: self._build_report(company, lane="bulk"))
+        return self._with_audio_job(report)
+
+    async def _prefetch_report(self, company: str) -> Dict[str, Any]:
+        """
+        Rebuild a company's report from the background prefetcher.
+
+        Args:
+            company (str): Normalized company name.
+
+        Returns:
+            dict: Comprehensive news analysis report.
+        """
+        return await self._build_report(company, lane="bulk")
+
+    async def _build_report(
+        self,
+        company: str,
+        deadline: Optional[Deadline] = None,
+        lane: str = "interactive"
+    ) -> Dict[str, Any]:
+        """
+        Fetch, analyze and cache a company's report.
+
+        Concurrent callers for the same company (foreground requests and
+        background prefetches) share a single build. It runs in the
+        admission lane of the caller that started it, without a latency
+        budget, so its full result is always cached. A budgeted caller
+        waits for it only as long as its own budget allows and then gets
+        a degraded report instead (see `_degraded_report`).
+
+        Args:
+            company (str): Normalized company name.
+            deadline (Deadline): Optional latency budget.
+            lane (str): Admission lane for the analysis stage.
+
+        Returns:
+            dict: Comprehensive news analysis report.
+
+        Raises:
+            Overloaded: If the analysis stage cannot be admitted, or the
+                budget runs out before any articles are available.
+        """
+        task = self.inflight_reports.get(company)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_analyze(company, lane))
+            self.inflight_reports[company] = task
+            task.add_done_callback(lambda done: self._forget_build(company, done))
+        if deadline is None or deadline.remaining() is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+        except asyncio.TimeoutError:
+            # The shared build keeps running and caches its full result
+            return await self._degraded_report(company, deadline)
+
+    def _forget_build(self, company: str, task: asyncio.Future) -> None:
+        """
+        Drop a finished shared build and its fetched articles.
+
+        Args:
+            company (str): Normalized company name.
+            task (asyncio.Future): The finished build.
+        """
+        if self.inflight_reports.get(company) is task:
+            self.inflight_reports.pop(company)
+            self.inflight_articles.pop(company, None)
+
+    async def _degraded_report(self, company: str, deadline: Deadline) -> Dict[str, Any]:
+        """
+        Build a cheap report for a caller whose budget ran out.
+
+        Uses the articles the shared build fetched, or else the last
+        fetched feed, with VADER on the untranslated text and cached or
+        empty topics. Nothing is cached or recorded to history.
+
+        Args:
+            company (str): Normalized company name.
+            deadline (Deadline): Exhausted latency budget.
+
+        Returns:
+            dict: Analysis report flagged as degraded.
+
+        Raises:
+            Overloaded: If no articles have been fetched yet.
+        """
+        articles = self.inflight_articles.get(company)
+        if articles is None:
+            articles = self.feed_fetcher.cached_articles(company)
+            if articles is None:
+                raise Overloaded(
+                    "interactive", 503, 1, "News not fetched within the latency budget"
+                )
+            deadline.degrade("fetch")
+        if not articles:
+            return self._create_empty_result(company)
+        deadline.degrade("analysis")
+        return await asyncio.to_thread(self._analyze_articles, articles, company, deadline)
+
+    async def _fetch_and_analyze(
+        self,
+        company: str,
+        lane: str = "interactive"
+    ) -> Dict[str, Any]:
+        """
+        Run the fetch and analysis pipeline for a company.
+
+        Only the analysis stage holds an inference slot; the network
+        fetch runs outside admission control.
+
+        Args:
+            company (str): Normalized company name.
+            lane (str): Admission lane for the analysis stage.
+
+        Returns:
+            dict: Comprehensive news analysis report.
+        """
+        # Fetch news, revalidating the feed seen last time
+        articles, feed_version = await self.feed_fetcher.fetch(company)
+        if not articles:
+            return self._create_empty_result(company)
+        # Let budgeted callers degrade on these while analysis runs
+        self.inflight_articles[company] = articles
+
+        # An unchanged feed keeps its previous (possibly expired) report
+        previous = self.news_cache.get(company)
+        if (
+            feed_version is not None
+            and previous is not None
+            and previous["feed_version"] == feed_version
+        ):
+            previous["expires_at"] = time.monotonic() + NEWS_CACHE_TTL
+            self.feed_fetcher.record_reuse()
+            return previous["result"]
+
+        # Analyze articles off the event loop
+        async with self.admission.slot(lane):
+            analysis_result = await asyncio.to_thread(
+                self._analyze_articles, articles, company
+            )
+        self.news_cache[company] = {
+            "result": analysis_result,
+            "expires_at": time.monotonic() + NEWS_CACHE_TTL,
+            "feed_version": feed_version
+        }
+        return analysis_result
+
+    def _analyze_articles(
+        self,
+        articles: List[Dict],
+        company: str,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Comprehensive analysis of news articles.
 
+        Once the deadline is spent, stages fall back to cheaper results:
+        VADER on the untranslated text and cached or empty topics.
+
         Args:
             articles (list): List of news articles.
             company (str): Company name.
+            deadline (Deadline): Optional latency budget.
 
         Returns:
             dict: Detailed analysis report.
         """
         analyzed_articles = []
         sentiment_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
+        embedding_usage = {"hits": 0, "misses": 0}
+
+        # Route non-English articles through batched translation, then
+        # batch model work across all articles of the request
+        deadline = deadline or Deadline()
+        texts = [article['summary'] for article in articles]
+        scoring_texts, languages = sentiment_utils.route_for_scoring(texts, deadline)
+        topics_per_article = sentiment_utils.extract_keywords_batch(
+            scoring_texts, usage=embedding_usage, deadline=deadline
+        )
 
-        for article in articles:
-            # Sentiment and topic analysis
-            sentiment = sentiment_utils.analyze_sentiment(article['summary'])
-            topics = sentiment_utils.extract_keywords(article['summary'])
+        for index, (article, language, scoring_text, topics) in enumerate(zip(
+            articles, languages, scoring_texts, topics_per_article
+        )):
+            # Sentiment analysis
+            score = sentiment_utils.polarity_score(scoring_text)
+            sentiment = sentiment_utils.classify_compound(score)
 
             analyzed_article = {
                 "title": article['title'],
                 "summary": article['summary'],
+                "language": language,
+                "published": parse_published(article.get('published')).isoformat(),
                 "sentiment": sentiment,
-                "topics": topics
+                "sentiment_score": score,
+                "topics": topics,
+                "degraded": deadline.articles.get(index, [])
             }
 
             analyzed_articles.append(analyzed_article)
             sentiment_counts[sentiment] += 1
 
+        # Record how much encoder work the phrase cache saved
+        lookups = embedding_usage["hits"] + embedding_usage["misses"]
+        self.last_embedding_usage = {
+            "company": company,
+            "phrase_lookups": lookups,
+            "encoder_calls_avoided": embedding_usage["hits"],
+            "hit_rate": embedding_usage["hits"] / lookups if lookups else 0.0
+        }
+
+        # Persist newly seen, fully analyzed articles and fold them into
+        # the live aggregate; degraded ones are recorded on a later full run.
+        # Undated articles are de-duplicated by link and first-seen time.
+        complete_articles = [
+            {
+                **analyzed,
+                "link": article.get('link', ''),
+                "published": analyzed["published"] if article.get('published') else None
+            }
+            for article, analyzed in zip(articles, analyzed_articles)
+            if not analyzed["degraded"]
+        ]
+        self.live_sentiment.seed(company)
+        for article in self.history_store.append(company, complete_articles):
+            self.live_sentiment.update(
+                company,
+                article["sentiment_score"],
+                article["sentiment"],
+                datetime.fromisoformat(article["published"]).timestamp()
+            )
+
         # Generate final sentiment summary
-        dominant_sentiment = max(sentiment_counts, key=sentiment_counts.get)
+        live = self.live_sentiment.snapshot(company)
+        if live is not None:
+            dominant_sentiment = sentiment_utils.classify_compound(live["mean"])
+        else:
+            dominant_sentiment = max(sentiment_counts, key=sentiment_counts.get)
         sentiment_summary = self._generate_sentiment_summary(
-            company, dominant_sentiment, sentiment_counts
+            company, dominant_sentiment, sentiment_counts, live
+        )
+
+        # Compare coverage across all article pairs
+        comparative = self.topic_overlap.compare(
+            [article["topics"] for article in analyzed_articles],
+            [article["sentiment_score"] for article in analyzed_articles],
+            [article["sentiment"] for article in analyzed_articles]
         )
 
         return {
             "company": company,
             "articles": analyzed_articles,
             "sentiment_distribution": sentiment_counts,
-            "sentiment_summary": sentiment_summary
+            "comparative_sentiment_score": comparative,
+            "sentiment_summary": sentiment_summary,
+            "degraded": deadline.report()
         }
 
+    def _stored_scores(self, company: str, since: float) -> List[tuple]:
+        """
+        Load stored scores used to seed a company's live aggregate.
+
+        Args:
+            company (str): Normalized company name.
+            since (float): Earliest publication time (epoch seconds).
+
+        Returns:
+            list: (epoch seconds, compound score, label), oldest first.
+        """
+        return self.history_store.scores(
+            company,
+            datetime.fromtimestamp(since, timezone.utc),
+            # Tolerate feeds whose clocks run slightly ahead
+            datetime.now(timezone.utc) + timedelta(days=1)
+        )
+
+    @staticmethod
+    def _parse_time(value: str) -> datetime:
+        """
+        Parse an ISO 8601 date or datetime query value as UTC.
+
+        Args:
+            value (str): Date or datetime string.
+
+        Returns:
+            datetime: Timezone-aware UTC timestamp.
+        """
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+
     def _create_empty_result(self, company: str) -> Dict[str, Any]:
         """
         Create a default result when no news is found.
@@ -150,7 +728,8 @@ class NewsAnalysisAPI:
         self, 
         company: str, 
         dominant_sentiment: str, 
-        sentiment_counts: Dict[str, int]
+        sentiment_counts: Dict[str, int],
+        live: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate a narrative sentiment summary.
@@ -159,6 +738,7 @@ class NewsAnalysisAPI:
             company (str): Company name.
             dominant_sentiment (str): Most prevalent sentiment.
             sentiment_counts (dict): Sentiment distribution.
+            live (dict): Optional time-decayed sentiment snapshot.
 
         Returns:
             str: Narrative sentiment summary.
@@ -171,6 +751,14 @@ class NewsAnalysisAPI:
             f"Neutral: {sentiment_counts['Neutral']/total_articles*100:.1f}%, "
             f"Negative: {sentiment_counts['Negative']/total_articles*100:.1f}%"
         )
+        if live is not None:
+            trend = "improving" if live["momentum"] > 0.05 else (
+                "deteriorating" if live["momentum"] < -0.05 else "steady"
+            )
+            summary_template += (
+                f". Recency-weighted sentiment score: {live['mean']:+.2f} "
+                f"(volatility {live['variance'] ** 0.5:.2f}), trend {trend}."
+            )
         return summary_template
 
 # Create API router instance
@@ -451,15 +451,38 @@ if analyze_button and company_name:
                         with col2:
                             # Sentiment Trend Line Chart
                             st.subheader("Sentiment Trend")
-                            fig = px.line(
-                                df, x=df.index, y="sentiment_score", 
-                                markers=True,
-                                color_discrete_sequence=["#2563eb"],
-                                labels={
-                                    "sentiment_score": "Sentiment (-1 to 1)", 
-                                    "index": "Article Index"
-                                }
+                            history_response = requests.get(
+                                f"{API_BASE_URL}/history",
+                                params={"company": company_name.replace(" ", ""), "bucket": "day"}
                             )
+                            history = (
+                                history_response.json().get("series", [])
+                                if history_response.status_code == 200
+                                else []
+                            )
+                            if history:
+                                history_df = pd.DataFrame(history)
+                                history_df["bucket_start"] = pd.to_datetime(history_df["bucket_start"])
+                                fig = px.line(
+                                    history_df, x="bucket_start", y="mean_compound",
+                                    markers=True,
+                                    color_discrete_sequence=["#2563eb"],
+                                    hover_data=["articles"],
+                                    labels={
+                                        "mean_compound": "Mean Sentiment (-1 to 1)",
+                                        "bucket_start": "Date"
+                                    }
+                                )
+                            else:
+                                fig = px.line(
+                                    df, x=df.index, y="sentiment_score",
+                                    markers=True,
+                                    color_discrete_sequence=["#2563eb"],
+                                    labels={
+                                        "sentiment_score": "Sentiment (-1 to 1)",
+                                        "index": "Article Index"
+                                    }
+                                )
                             fig.add_hline(y=0, line_dash="dash", line_color="gray")
                             fig.update_layout(margin=dict(t=0, b=0, l=0, r=0))
                             st.plotly_chart(fig, use_container_width=True)
@@ -518,8 +541,12 @@ if analyze_button and company_name:
                         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
                         st.subheader("📊 Coverage Differences")
                         
-                        if "Coverage Differences" in data["Comparative Sentiment Score"]:
-                            for diff in data["Comparative Sentiment Score"]["Coverage Differences"]:
+                        comparative = data.get(
+                            "comparative_sentiment_score",
+                            data.get("Comparative Sentiment Score", {})
+                        )
+                        if "Coverage Differences" in comparative:
+                            for diff in comparative["Coverage Differences"]:
                                 # Determine sentiment color
                                 sentiment_color = (
                                     "#f44336" 
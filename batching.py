@@ -0,0 +1,161 @@
+"""Cross-Request Dynamic Micro-Batching for Model Inference."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from metrics import Histogram
+
+BATCH_SIZE_BOUNDS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+
+
+class MicroBatcher:
+    """
+    Collects work items from concurrent callers into batched model calls.
+
+    Items are grouped by a hashable key (e.g. generation parameters) and a
+    group is flushed as soon as it reaches `max_batch_size` or its oldest
+    item has waited `max_wait_ms`. A single worker thread runs every batch,
+    so inference is serialized while callers from any thread or request
+    block only on their own futures.
+    """
+    def __init__(
+        self,
+        name: str,
+        process_batch: Callable[[List[Any], Hashable], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Configure the batcher.
+
+        Args:
+            name (str): Name used in metrics and error messages.
+            process_batch (callable): Runs one batch; receives the items and
+                their group key, returns one result per item.
+            max_batch_size (int): Largest batch handed to the model.
+            max_wait_ms (float): Longest time an item waits for companions.
+        """
+        self.name = name
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue = queue.Queue()
+        self.worker: Optional[threading.Thread] = None
+        self.start_lock = threading.Lock()
+        self.batch_sizes = Histogram(BATCH_SIZE_BOUNDS)
+        self.queue_waits = Histogram()
+        self.batch_times = Histogram()
+
+    def submit(self, item: Any, group: Hashable = None) -> Future:
+        """
+        Queue one item for batched processing.
+
+        Args:
+            item: Input for `process_batch`.
+            group (hashable): Items are only batched with the same group.
+
+        Returns:
+            Future: Resolves to the item's result.
+        """
+        if self.worker is None:
+            with self.start_lock:
+                if self.worker is None:
+                    self.worker = threading.Thread(
+                        target=self._run, name=f"{self.name}-batcher", daemon=True
+                    )
+                    self.worker.start()
+
+        future = Future()
+        self.queue.put((group, item, future, time.monotonic()))
+        return future
+
+    def map(self, items: List[Any], group: Hashable = None) -> List[Any]:
+        """
+        Submit several items and wait for all results.
+
+        Args:
+            items (list): Inputs for `process_batch`.
+            group (hashable): Group key shared by all items.
+
+        Returns:
+            list: Results in input order.
+        """
+        futures = [self.submit(item, group) for item in items]
+        return [future.result() for future in futures]
+
+    def _run(self) -> None:
+        """
+        Worker loop: accumulate items per group and flush full or stale groups.
+        """
+        pending: Dict[Hashable, list] = {}
+        while True:
+            # Flush stale groups first, so a busy group cannot delay them
+            now = time.monotonic()
+            stale = [
+                group for group, entries in pending.items()
+                if entries[0][3] + self.max_wait <= now
+            ]
+            for group in stale:
+                self._flush(group, pending.pop(group))
+
+            timeout = None
+            if pending:
+                oldest = min(entries[0][3] for entries in pending.values())
+                timeout = max(0.0, oldest + self.max_wait - time.monotonic())
+
+            try:
+                entry = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            pending.setdefault(entry[0], []).append(entry)
+            if len(pending[entry[0]]) >= self.max_batch_size:
+                self._flush(entry[0], pending.pop(entry[0]))
+
+    def _flush(self, group: Hashable, entries: list) -> None:
+        """
+        Run one batch and resolve its futures.
+
+        Args:
+            group (hashable): Group key of the batch.
+            entries (list): Queued (group, item, future, enqueued_at) tuples.
+        """
+        # Skip items whose callers gave up (e.g. an exhausted latency budget)
+        entries = [entry for entry in entries if entry[2].set_running_or_notify_cancel()]
+        if not entries:
+            return
+
+        started = time.monotonic()
+        self.batch_sizes.observe(len(entries))
+        for entry in entries:
+            self.queue_waits.observe((started - entry[3]) * 1000)
+
+        try:
+            results = self.process_batch([entry[1] for entry in entries], group)
+            for entry, result in zip(entries, results):
+                entry[2].set_result(result)
+        except Exception as e:
+            print(f"{self.name} Batch Error: {e}")
+            for entry in entries:
+                if not entry[2].done():
+                    entry[2].set_exception(e)
+        finally:
+            self.batch_times.observe((time.monotonic() - started) * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Summarize batching behaviour.
+
+        Returns:
+            dict: Configuration, queue size and batch-size/wait histograms.
+        """
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queued": self.queue.qsize(),
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_ms": self.queue_waits.snapshot(),
+            "batch_time_ms": self.batch_times.snapshot()
+        }
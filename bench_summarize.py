@@ -0,0 +1,152 @@
+"""
+Summarization Cost Benchmark for the News Sentiment Analysis Project.
+
+Builds synthetic articles of increasing length from the load-test feed
+headlines, runs them through `SentimentAnalyzer.summarize_texts` and
+reports the per-document cost: wall time, tokens fed to the model, model
+inputs and chunks, and whether the per-request token cap was hit.
+
+Example:
+    python bench_summarize.py --words 50,300,1000,3000,10000 --docs 3 --json bench.json
+"""
+import argparse
+import json
+import re
+import time
+from typing import Dict, Any, List
+
+from loadtest import DEFAULT_FEEDS
+
+
+def load_sentences(feeds_path: str) -> List[str]:
+    """
+    Turn the load-test feed headlines into sentences.
+
+    Args:
+        feeds_path (str): Path to the feed fixture JSON.
+
+    Returns:
+        list: Headlines without the trailing " - Source", ending in a period.
+    """
+    with open(feeds_path, "r", encoding="utf-8") as f:
+        feeds = json.load(f)
+    sentences = []
+    for articles in feeds.values():
+        for article in articles:
+            title = re.sub(r"\s+-\s+[^-]+$", "", article["title"]).strip()
+            sentences.append(title.rstrip(".") + ".")
+    return sentences
+
+
+def build_document(sentences: List[str], words: int, offset: int = 0) -> str:
+    """
+    Concatenate sentences until the document reaches a word count.
+
+    Args:
+        sentences (list): Sentence pool.
+        words (int): Target word count.
+        offset (int): Starting position in the pool, so documents differ.
+
+    Returns:
+        str: Synthetic article text.
+    """
+    parts, count, index = [], 0, offset
+    while count < words:
+        sentence = sentences[index % len(sentences)]
+        parts.append(sentence)
+        count += len(sentence.split())
+        index += 1
+    return " ".join(parts)
+
+
+def run_benchmark(word_counts: List[int], docs: int, max_length: int) -> List[Dict[str, Any]]:
+    """
+    Time summarization for each document length.
+
+    Each length is run as its own request of `docs` documents so the
+    per-request token cap applies as it would in the API.
+
+    Args:
+        word_counts (list): Document lengths in words.
+        docs (int): Documents per length.
+        max_length (int): Summary length passed to the summarizer.
+
+    Returns:
+        list: One result row per document length.
+    """
+    from utils import sentiment_utils
+
+    sentences = load_sentences(DEFAULT_FEEDS)
+    # Warm up the model so the first row does not pay for loading
+    sentiment_utils.summarize_texts([build_document(sentences, 200)], max_length=max_length)
+
+    rows = []
+    for words in word_counts:
+        texts = [build_document(sentences, words, offset=i * 7) for i in range(docs)]
+        input_tokens = sum(sentiment_utils._count_tokens(texts))
+        usage: Dict[str, int] = {}
+        started = time.perf_counter()
+        sentiment_utils.summarize_texts(texts, max_length=max_length, usage=usage)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        rows.append({
+            "words": words,
+            "docs": docs,
+            "input_tokens_per_doc": input_tokens / docs,
+            "tokens_processed_per_doc": usage.get("tokens_processed", 0) / docs,
+            "model_inputs_per_doc": usage.get("model_inputs", 0) / docs,
+            "chunks_per_doc": usage.get("chunks", 0) / docs,
+            "capped_documents": usage.get("capped_documents", 0),
+            "ms_per_doc": elapsed_ms / docs,
+            "ms_per_1k_input_tokens": elapsed_ms / input_tokens * 1000 if input_tokens else 0.0
+        })
+    return rows
+
+
+def format_report(rows: List[Dict[str, Any]]) -> str:
+    """
+    Render benchmark rows as a fixed-width table.
+
+    Args:
+        rows (list): Output of `run_benchmark`.
+
+    Returns:
+        str: Table text.
+    """
+    header = (
+        f"{'words':>7} {'in tok':>8} {'fed tok':>8} {'inputs':>7} "
+        f"{'chunks':>7} {'capped':>7} {'ms/doc':>9} {'ms/1k tok':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['words']:>7} {row['input_tokens_per_doc']:>8.0f} "
+            f"{row['tokens_processed_per_doc']:>8.0f} {row['model_inputs_per_doc']:>7.1f} "
+            f"{row['chunks_per_doc']:>7.1f} {row['capped_documents']:>7} "
+            f"{row['ms_per_doc']:>9.0f} {row['ms_per_1k_input_tokens']:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """
+    Parse arguments, run the benchmark and print or save the report.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark summarization cost by input length.")
+    parser.add_argument("--words", default="50,300,1000,3000,10000",
+                        help="Comma-separated document lengths in words")
+    parser.add_argument("--docs", type=int, default=3, help="Documents per length")
+    parser.add_argument("--max-length", type=int, default=50, help="Summary length in tokens")
+    parser.add_argument("--json", dest="json_path", help="Also write rows to this JSON file")
+    args = parser.parse_args()
+
+    word_counts = [int(value) for value in args.words.split(",") if value.strip()]
+    rows = run_benchmark(word_counts, args.docs, args.max_length)
+    print(format_report(rows))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Vectorized Topic-Overlap Comparison for News Sentiment Analysis Project."""
+
+from typing import Dict, Any, List
+
+import numpy as np
+from scipy import sparse
+
+SAME_SENTIMENT_IMPACT = "The sentiment consistency may stabilize stock movements."
+MIXED_SENTIMENT_IMPACT = "This may create uncertainty in stock trends."
+
+
+class TopicOverlapEngine:
+    """
+    Compares every pair of articles by topics and sentiment at once.
+
+    Articles become rows of a sparse binary article-by-topic matrix; one
+    sparse product gives the shared-topic counts of all pairs, from which
+    cosine similarity follows. Sentiment contrast is the absolute
+    difference of compound scores. Pairs are ranked by divergence, the
+    mean of topic dissimilarity and normalized sentiment contrast, and
+    only the top K are rendered. Articles without topics have no topic
+    vector to compare, so pairs involving them are not ranked. The output
+    keeps the "Coverage Differences" / "Topic Overlap" shape rendered by
+    the frontend and shown in the README.
+    """
+    def __init__(self, top_k: int = 10):
+        """
+        Args:
+            top_k (int): Number of most divergent pairs to report.
+        """
+        self.top_k = top_k
+
+    def compare(
+        self,
+        topics_per_article: List[List[str]],
+        scores: List[float],
+        labels: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Build the comparative coverage analysis for one report.
+
+        Args:
+            topics_per_article (list): Topic list of each article.
+            scores (list): Compound sentiment score of each article.
+            labels (list): Sentiment label of each article.
+
+        Returns:
+            dict: "Coverage Differences" for the top divergent pairs and
+                "Topic Overlap" with common and per-article unique topics.
+        """
+        matrix, vocabulary = self._topic_matrix(topics_per_article)
+        n = matrix.shape[0]
+        document_frequency = np.asarray(matrix.sum(axis=0)).ravel()
+
+        result = {
+            "Pairs Compared": 0,
+            "Coverage Differences": [],
+            "Topic Overlap": {
+                "Common Topics": [
+                    vocabulary[column] for column in np.flatnonzero(document_frequency > 1)
+                ],
+                **self._unique_topics(matrix, vocabulary, document_frequency)
+            }
+        }
+        if n < 2 or self.top_k < 1:
+            return result
+
+        # Shared-topic counts for every pair in one sparse product
+        overlap = (matrix @ matrix.T).toarray()
+        sizes = np.diag(overlap).astype(float)
+        norms = np.sqrt(np.outer(sizes, sizes))
+        similarity = np.divide(overlap, norms, out=np.zeros_like(norms), where=norms > 0)
+        score_vector = np.asarray(scores, dtype=float)
+        contrast = np.abs(score_vector[:, None] - score_vector[None, :])
+
+        # Rank only pairs where both articles have topics
+        rows, cols = np.triu_indices(n, k=1)
+        ranked = (sizes[rows] > 0) & (sizes[cols] > 0)
+        rows, cols = rows[ranked], cols[ranked]
+        result["Pairs Compared"] = len(rows)
+        if len(rows) == 0:
+            return result
+
+        # Compound scores lie in [-1, 1], so contrast is normalized by 2
+        divergence = 0.5 * (1.0 - similarity[rows, cols]) + 0.25 * contrast[rows, cols]
+        k = min(self.top_k, len(divergence))
+        top = np.argpartition(-divergence, k - 1)[:k]
+        top = top[np.argsort(-divergence[top], kind="stable")]
+
+        for pair in top:
+            i, j = int(rows[pair]), int(cols[pair])
+            shared = matrix[i].multiply(matrix[j]).indices
+            result["Coverage Differences"].append({
+                "Comparison": (
+                    f"Article {i + 1} covers {topics_per_article[i]}, "
+                    f"while Article {j + 1} focuses on {topics_per_article[j]}."
+                ),
+                "Sentiment Impact": (
+                    f"Article {i + 1} has a {labels[i]} sentiment, "
+                    f"while Article {j + 1} has a {labels[j]} sentiment."
+                ),
+                "Stock Impact": (
+                    SAME_SENTIMENT_IMPACT if labels[i] == labels[j] else MIXED_SENTIMENT_IMPACT
+                ),
+                "Articles": [i + 1, j + 1],
+                "Shared Topics": sorted(vocabulary[column] for column in shared),
+                "Topic Similarity": round(float(similarity[i, j]), 4),
+                "Sentiment Contrast": round(float(contrast[i, j]), 4),
+                "Divergence": round(float(divergence[pair]), 4)
+            })
+        return result
+
+    @staticmethod
+    def _topic_matrix(topics_per_article: List[List[str]]):
+        """
+        Encode article topics as a sparse binary matrix.
+
+        Args:
+            topics_per_article (list): Topic list of each article.
+
+        Returns:
+            tuple: CSR matrix (articles x topics) and column-to-topic list.
+        """
+        columns: Dict[str, int] = {}
+        rows, cols = [], []
+        for row, topics in enumerate(topics_per_article):
+            for topic in dict.fromkeys(topics):
+                rows.append(row)
+                cols.append(columns.setdefault(topic, len(columns)))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(topics_per_article), len(columns))
+        )
+        matrix.sort_indices()
+        return matrix, list(columns)
+
+    @staticmethod
+    def _unique_topics(matrix, vocabulary: List[str], document_frequency) -> Dict[str, List[str]]:
+        """
+        Find the topics that appear in exactly one article.
+
+        Args:
+            matrix: CSR article-by-topic matrix.
+            vocabulary (list): Column-to-topic list.
+            document_frequency: Number of articles per topic.
+
+        Returns:
+            dict: "Unique Topics in Article N" to that article's unique
+                topics, for articles that have any.
+        """
+        unique_columns = np.flatnonzero(document_frequency == 1)
+        unique = matrix[:, unique_columns].tocsr()
+        return {
+            f"Unique Topics in Article {row + 1}": [
+                vocabulary[unique_columns[column]]
+                for column in unique.indices[unique.indptr[row]:unique.indptr[row + 1]]
+            ]
+            for row in range(unique.shape[0])
+            if unique.indptr[row + 1] > unique.indptr[row]
+        }
@@ -0,0 +1,106 @@
+"""Per-Request Latency Budgets for News Sentiment Analysis Project."""
+
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+
+class Deadline:
+    """
+    Latency budget that travels with a request through the pipeline.
+
+    Stages ask how much time is left, fall back to a cheaper result when
+    it runs out, and record what they degraded so the response can say so.
+    An unbounded deadline (no budget) never expires.
+    """
+    def __init__(self, budget_ms: Optional[float] = None):
+        """
+        Start the budget clock.
+
+        Args:
+            budget_ms (float): Total budget in milliseconds, or None for no limit.
+        """
+        self.budget_ms = budget_ms
+        self.expires_at = time.monotonic() + budget_ms / 1000 if budget_ms else None
+        self.stages: List[str] = []
+        self.articles: Dict[int, List[str]] = {}
+        self.lock = threading.Lock()
+
+    def remaining(self) -> Optional[float]:
+        """
+        Seconds left in the budget.
+
+        Returns:
+            float: Remaining seconds (never negative), or None if unbounded.
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """
+        Returns:
+            bool: True once the budget is used up.
+        """
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def wait(self, future: Future) -> Any:
+        """
+        Wait for a future within the remaining budget.
+
+        A timed-out future is cancelled so queued work is dropped.
+
+        Args:
+            future (Future): Pending result.
+
+        Returns:
+            Any: The future's result.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the budget runs out first.
+        """
+        try:
+            return future.result(timeout=self.remaining())
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def degrade(self, stage: str, article: Optional[int] = None) -> None:
+        """
+        Record that a stage fell back to a cheaper result.
+
+        Args:
+            stage (str): Pipeline stage name.
+            article (int): Index of the affected article, if per-article.
+        """
+        with self.lock:
+            if stage not in self.stages:
+                self.stages.append(stage)
+            if article is not None:
+                article_stages = self.articles.setdefault(article, [])
+                if stage not in article_stages:
+                    article_stages.append(stage)
+
+    @property
+    def degraded(self) -> bool:
+        """
+        Returns:
+            bool: True if any stage was degraded.
+        """
+        return bool(self.stages)
+
+    def report(self) -> Optional[Dict[str, Any]]:
+        """
+        Describe the degradation for the response.
+
+        Returns:
+            dict: Budget, degraded stages and article indices, or None.
+        """
+        if not self.stages:
+            return None
+        return {
+            "budget_ms": self.budget_ms,
+            "stages": list(self.stages),
+            "articles": sorted(self.articles)
+        }
@@ -0,0 +1,263 @@
+"""Persistent Embedding Cache for KeyBERT Candidate Phrases."""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+
+class PhraseEmbeddingCache:
+    """
+    Two-tier embedding store keyed by phrase and encoder version.
+
+    Recently used vectors live in an in-memory LRU; encoded vectors are
+    persisted to a memory-mapped NumPy array on disk holding at most
+    `max_entries` rows. An append-only JSON-lines log maps phrases to
+    rows: each new phrase appends one line, and once the store is full
+    the oldest-written phrase gives up its row. The log is rewritten
+    only when stale lines outnumber live ones.
+    """
+    def __init__(
+        self,
+        cache_dir: str,
+        encoder_version: str,
+        lru_size: int = 50000,
+        initial_capacity: int = 4096,
+        max_entries: int = 100000
+    ):
+        """
+        Open (or create) the on-disk store for an encoder version.
+
+        Args:
+            cache_dir (str): Directory holding the array and index files.
+            encoder_version (str): Identifier of the embedding model.
+            lru_size (int): Maximum number of vectors kept in memory.
+            initial_capacity (int): Rows allocated for a new array file.
+            max_entries (int): Maximum number of vectors kept on disk.
+        """
+        self.encoder_version = encoder_version
+        self.lru_size = lru_size
+        self.initial_capacity = initial_capacity
+        self.max_entries = max_entries
+        self.lru = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "encoder_calls": 0}
+
+        safe_version = re.sub(r"[^A-Za-z0-9_.-]", "_", encoder_version)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.array_path = os.path.join(cache_dir, f"{safe_version}.npy")
+        self.index_path = os.path.join(cache_dir, f"{safe_version}.jsonl")
+
+        # Phrase -> row in write order (oldest first), and the reverse map
+        self.index: "OrderedDict[str, int]" = OrderedDict()
+        self.row_owner: Dict[int, str] = {}
+        self.log_lines = 0
+        self.vectors: Optional[np.memmap] = None
+        self._load()
+
+    def _load(self) -> None:
+        """
+        Replay the phrase log and map the array file, if present.
+        """
+        try:
+            if os.path.exists(self.array_path) and os.path.exists(self.index_path):
+                self.vectors = np.load(self.array_path, mmap_mode="r+")
+                rows = min(self.vectors.shape[0], self.max_entries)
+                with open(self.index_path, "r", encoding="utf-8") as index_file:
+                    for line in index_file:
+                        try:
+                            phrase, row = json.loads(line)
+                        except ValueError:
+                            # Torn last line from an interrupted append
+                            continue
+                        self.log_lines += 1
+                        if row < rows:
+                            self._assign(phrase, row)
+        except Exception as e:
+            print(f"Embedding Cache Load Error: {e}")
+            self.index = OrderedDict()
+            self.row_owner = {}
+            self.log_lines = 0
+            self.vectors = None
+
+    def _assign(self, phrase: str, row: int) -> None:
+        """
+        Point a phrase at a row, dropping whatever used either before.
+
+        Args:
+            phrase (str): Phrase key.
+            row (int): Array row holding its vector.
+        """
+        previous_row = self.index.pop(phrase, None)
+        if previous_row is not None:
+            self.row_owner.pop(previous_row, None)
+        previous_phrase = self.row_owner.get(row)
+        if previous_phrase is not None:
+            self.index.pop(previous_phrase, None)
+        self.index[phrase] = row
+        self.row_owner[row] = phrase
+
+    def _ensure_capacity(self, rows: int, dim: int) -> None:
+        """
+        Grow the memory-mapped array so it can hold the given row count.
+
+        Args:
+            rows (int): Number of rows required.
+            dim (int): Embedding dimensionality.
+        """
+        if self.vectors is not None and self.vectors.shape[0] >= rows:
+            return
+
+        capacity = max(self.initial_capacity, rows)
+        if self.vectors is not None:
+            capacity = max(capacity, self.vectors.shape[0] * 2)
+        capacity = max(rows, min(capacity, self.max_entries))
+
+        tmp_path = f"{self.array_path}.tmp.npy"
+        grown = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=np.float32, shape=(capacity, dim)
+        )
+        if self.vectors is not None:
+            used = min(self.vectors.shape[0], capacity)
+            grown[:used] = self.vectors[:used]
+            del self.vectors
+        grown.flush()
+        del grown
+        os.replace(tmp_path, self.array_path)
+        self.vectors = np.load(self.array_path, mmap_mode="r+")
+
+    def _persist(self, phrases: List[str], embeddings: np.ndarray) -> None:
+        """
+        Write newly encoded phrases to the on-disk store.
+
+        Free rows are used first; once the store is full, the
+        oldest-written phrases are evicted and their rows reused. Vectors
+        are flushed before their log lines are appended, so the log never
+        points at unwritten rows.
+
+        Args:
+            phrases (list): Phrases to store.
+            embeddings (np.ndarray): Matching embedding matrix.
+        """
+        try:
+            phrases = phrases[-self.max_entries:]
+            embeddings = embeddings[-self.max_entries:]
+            free = min(len(phrases), self.max_entries - len(self.index))
+            start = len(self.index)
+            rows = list(range(start, start + free))
+            rows += list(islice(self.index.values(), len(phrases) - free))
+
+            self._ensure_capacity(start + free, embeddings.shape[1])
+            self.vectors[rows] = embeddings
+            self.vectors.flush()
+            for phrase, row in zip(phrases, rows):
+                self._assign(phrase, row)
+
+            with open(self.index_path, "a", encoding="utf-8") as index_file:
+                for phrase, row in zip(phrases, rows):
+                    index_file.write(json.dumps([phrase, row]) + "\n")
+            self.log_lines += len(phrases)
+            if self.log_lines > 2 * max(len(self.index), self.initial_capacity):
+                self._compact_log()
+        except Exception as e:
+            print(f"Embedding Cache Persist Error: {e}")
+
+    def _compact_log(self) -> None:
+        """
+        Rewrite the phrase log with one line per live phrase, oldest first.
+        """
+        tmp_index = f"{self.index_path}.tmp"
+        with open(tmp_index, "w", encoding="utf-8") as index_file:
+            for phrase, row in self.index.items():
+                index_file.write(json.dumps([phrase, row]) + "\n")
+        os.replace(tmp_index, self.index_path)
+        self.log_lines = len(self.index)
+
+    def _remember(self, phrase: str, vector: np.ndarray) -> None:
+        """
+        Insert a vector into the LRU tier, evicting the oldest entry.
+
+        Args:
+            phrase (str): Phrase key.
+            vector (np.ndarray): Phrase embedding.
+        """
+        self.lru[phrase] = vector
+        self.lru.move_to_end(phrase)
+        if len(self.lru) > self.lru_size:
+            self.lru.popitem(last=False)
+
+    def get_or_encode(
+        self,
+        phrases: List[str],
+        encode: Callable[[List[str]], np.ndarray],
+        usage: Optional[Dict[str, int]] = None
+    ) -> np.ndarray:
+        """
+        Return embeddings for phrases, encoding only unseen ones.
+
+        Args:
+            phrases (list): Candidate phrases to embed.
+            encode (callable): Batch encoder for phrases missing from the cache.
+            usage (dict): Optional counter updated with this call's hits/misses.
+
+        Returns:
+            np.ndarray: Embedding matrix aligned with `phrases`.
+        """
+        found: Dict[str, np.ndarray] = {}
+        with self.lock:
+            for phrase in phrases:
+                if phrase in self.lru:
+                    self.lru.move_to_end(phrase)
+                    found[phrase] = self.lru[phrase]
+                elif phrase in self.index and self.vectors is not None:
+                    vector = np.array(self.vectors[self.index[phrase]])
+                    self._remember(phrase, vector)
+                    found[phrase] = vector
+
+        missing = list(dict.fromkeys(p for p in phrases if p not in found))
+        if missing:
+            encoded = np.asarray(encode(missing), dtype=np.float32)
+            with self.lock:
+                fresh_rows = [i for i, p in enumerate(missing) if p not in self.index]
+                if fresh_rows:
+                    self._persist([missing[i] for i in fresh_rows], encoded[fresh_rows])
+                for phrase, vector in zip(missing, encoded):
+                    self._remember(phrase, vector)
+                    found[phrase] = vector
+
+        hits = len(phrases) - len(missing)
+        with self.lock:
+            self.stats["hits"] += hits
+            self.stats["misses"] += len(missing)
+            self.stats["encoder_calls"] += 1 if missing else 0
+        if usage is not None:
+            usage["hits"] = usage.get("hits", 0) + hits
+            usage["misses"] = usage.get("misses", 0) + len(missing)
+
+        return np.vstack([found[p] for p in phrases]) if phrases else np.empty((0, 0))
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Summarize lifetime cache effectiveness.
+
+        Returns:
+            dict: Hit/miss counts, hit rate and store sizes.
+        """
+        with self.lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "encoder_version": self.encoder_version,
+                "hits": self.stats["hits"],
+                "misses": self.stats["misses"],
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+                "encoder_calls": self.stats["encoder_calls"],
+                "encoder_calls_avoided": self.stats["hits"],
+                "memory_entries": len(self.lru),
+                "disk_entries": len(self.index),
+                "disk_capacity": self.max_entries
+            }
@@ -0,0 +1,245 @@
+"""Conditional, Pooled RSS Feed Fetching for News Sentiment Analysis Project."""
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlparse
+
+import feedparser
+import httpx
+
+from metrics import Histogram
+
+
+class ConditionalFeedFetcher:
+    """
+    Fetches company news feeds over one shared keep-alive HTTP client.
+
+    Each feed URL remembers its ETag and Last-Modified validators and the
+    articles parsed from its last body, so refetches are conditional and
+    a 304 reuses the parsed articles without downloading or parsing the
+    feed again. Every result carries a version (a hash of the parsed
+    articles, so build timestamps in the feed do not count as changes)
+    that callers can compare to skip re-analyzing an unchanged feed.
+    Requests per host are limited by a semaphore. When a fetch fails, the
+    fallback fetcher (e.g. `fetch_news`) is used instead.
+
+    `fetch_news` only takes a company name and does its own download, so
+    it cannot be handed a revalidated body or the shared client. The
+    fetcher therefore downloads the feed itself and parses each changed
+    body with `parser`. The default parser yields the same article dicts
+    as `fetch_news`: title, summary, link and published. A parser that
+    does extra cleaning can be passed in place of the default.
+    """
+    def __init__(
+        self,
+        url_template: str,
+        fallback: Optional[Callable[[str], Awaitable[List[Dict[str, Any]]]]] = None,
+        parser: Optional[Callable[[bytes], List[Dict[str, Any]]]] = None,
+        per_host_limit: int = 4,
+        timeout: float = 15.0,
+        max_feeds: int = 1000
+    ):
+        """
+        Configure the fetcher.
+
+        Args:
+            url_template (str): Feed URL with a `{query}` placeholder.
+            fallback (callable): Coroutine returning articles for a company,
+                used when the conditional fetch fails.
+            parser (callable): Turns a raw feed body into article dicts
+                (default `parse_feed`).
+            per_host_limit (int): Maximum concurrent requests per host.
+            timeout (float): Request timeout in seconds.
+            max_feeds (int): Number of feeds whose validators are retained.
+        """
+        self.url_template = url_template
+        self.fallback = fallback
+        self.parser = parser or parse_feed
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.max_feeds = max_feeds
+        self.client: Optional[httpx.AsyncClient] = None
+        self.host_limits: Dict[str, asyncio.Semaphore] = {}
+        self.feeds: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.fetch_times = Histogram()
+        self.counters = {
+            "requests": 0,
+            "conditional_requests": 0,
+            "not_modified": 0,
+            "unchanged_bodies": 0,
+            "bytes_fetched": 0,
+            "errors": 0,
+            "fallbacks": 0,
+            "reports_reused": 0
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Create the shared client on first use, on the running event loop.
+
+        Returns:
+            httpx.AsyncClient: Pooled keep-alive client.
+        """
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
+                headers={"User-Agent": "news-sentiment-analysis/1.0"}
+            )
+        return self.client
+
+    def feed_url(self, company: str) -> str:
+        """
+        Build the feed URL for a company.
+
+        Args:
+            company (str): Company name.
+
+        Returns:
+            str: Feed URL.
+        """
+        return self.url_template.format(query=quote_plus(company))
+
+    async def fetch(self, company: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch a company's articles, revalidating any previously seen feed.
+
+        Args:
+            company (str): Company name.
+
+        Returns:
+            tuple: Articles (title, summary, link, published) and the feed
+                version, or None as version when the fallback was used.
+        """
+        url = self.feed_url(company)
+        try:
+            return await self._fetch_feed(url)
+        except Exception as e:
+            self.counters["errors"] += 1
+            print(f"Feed Fetch Error ({url}): {e}")
+            if self.fallback is None:
+                raise
+        self.counters["fallbacks"] += 1
+        return await self.fallback(company), None
+
+    async def _fetch_feed(self, url: str) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Conditionally GET one feed and parse it if it changed.
+
+        Args:
+            url (str): Feed URL.
+
+        Returns:
+            tuple: Parsed articles and the feed version.
+        """
+        cached = self.feeds.get(url)
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+            if headers:
+                self.counters["conditional_requests"] += 1
+
+        host = urlparse(url).netloc
+        limit = self.host_limits.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+        loop = asyncio.get_running_loop()
+        async with limit:
+            started = loop.time()
+            response = await self._get_client().get(url, headers=headers)
+            self.fetch_times.observe((loop.time() - started) * 1000)
+        self.counters["requests"] += 1
+        self.counters["bytes_fetched"] += response.num_bytes_downloaded
+
+        if response.status_code == 304 and cached is not None:
+            self.counters["not_modified"] += 1
+            self.feeds.move_to_end(url)
+            return cached["articles"], cached["version"]
+        response.raise_for_status()
+
+        body_hash = hashlib.sha1(response.content).hexdigest()
+        if cached is not None and cached["body_hash"] == body_hash:
+            # Server ignored the validators but the feed did not change
+            self.counters["unchanged_bodies"] += 1
+            articles, version = cached["articles"], cached["version"]
+        else:
+            articles = await asyncio.to_thread(self.parser, response.content)
+            version = hashlib.sha1(
+                json.dumps(articles, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+
+        self.feeds[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body_hash": body_hash,
+            "version": version,
+            "articles": articles
+        }
+        self.feeds.move_to_end(url)
+        while len(self.feeds) > self.max_feeds:
+            self.feeds.popitem(last=False)
+        return articles, version
+
+    def cached_articles(self, company: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the articles parsed from a company's last fetched feed.
+
+        Args:
+            company (str): Company name.
+
+        Returns:
+            list: Previously parsed articles, or None if the feed was never fetched.
+        """
+        cached = self.feeds.get(self.feed_url(company))
+        return cached["articles"] if cached is not None else None
+
+    def record_reuse(self) -> None:
+        """
+        Count a report served again because its feed was unchanged.
+        """
+        self.counters["reports_reused"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Summarize fetch and revalidation behaviour.
+
+        Returns:
+            dict: Counters, revalidation hit rate and fetch latency histogram.
+        """
+        conditional = self.counters["conditional_requests"]
+        return {
+            **self.counters,
+            "feeds_tracked": len(self.feeds),
+            "revalidation_hit_rate": (
+                self.counters["not_modified"] / conditional if conditional else 0.0
+            ),
+            "fetch_ms": self.fetch_times.snapshot()
+        }
+
+
+def parse_feed(content: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse an RSS body into article dictionaries.
+
+    Args:
+        content (bytes): Raw feed body.
+
+    Returns:
+        list: Articles with title, summary, link and published date, in
+            the shape `fetch_news` returns.
+    """
+    feed = feedparser.parse(content)
+    return [
+        {
+            "title": entry.get("title", ""),
+            "summary": entry.get("summary", ""),
+            "link": entry.get("link", ""),
+            "published": entry.get("published")
+        }
+        for entry in feed.entries
+    ]
@@ -0,0 +1,390 @@
+"""Columnar Historical Sentiment Store for News Sentiment Analysis Project."""
+
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+HISTORY_SCHEMA = pa.schema([
+    ("timestamp", pa.timestamp("ms", tz="UTC")),
+    ("title", pa.string()),
+    ("compound", pa.float32()),
+    ("label", pa.string()),
+    ("topics", pa.list_(pa.string())),
+])
+
+BUCKETS = ("hour", "day", "week", "month")
+PARTITION_FILE = "part-0.parquet"
+UNDATED_LOG = "undated.jsonl"
+
+
+class SentimentHistoryStore:
+    """
+    Parquet store of analyzed articles, partitioned by company and day,
+    with bucketed aggregate queries.
+
+    Each (company, day) partition is kept as a single file: appending
+    merges new rows into it and rewrites it atomically, skipping articles
+    already stored there. Duplicates are caught across restarts and the
+    file count stays at one per partition.
+
+    Articles without a publication date have no stable (title, timestamp)
+    key. They are keyed by link (or title) instead, in an append-only
+    per-company log, and stored once with the time they were first seen.
+    """
+    def __init__(self, root: str, seen_limit: int = 100000):
+        """
+        Initialize the store rooted at a local directory.
+
+        Args:
+            root (str): Directory that holds the partitioned dataset.
+            seen_limit (int): Number of recent article keys remembered in
+                memory to skip re-reading partitions for repeated articles.
+        """
+        self.root = root
+        self.seen_limit = seen_limit
+        self.seen = OrderedDict()
+        self.undated: Dict[str, Dict[str, str]] = {}
+        self.lock = threading.Lock()
+        self.filesystem = fs.LocalFileSystem(use_mmap=True)
+
+    def append(self, company: str, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Record analyzed articles not already present in the store.
+
+        Args:
+            company (str): Normalized company name.
+            articles (list): Analyzed articles with `published` (ISO 8601
+                UTC, or None if the feed gave no date), `sentiment_score`,
+                `sentiment`, `topics` and optional `link` fields.
+
+        Returns:
+            list: The articles that were newly recorded, with `published`
+                set to the first-seen time for undated ones.
+        """
+        fresh = []
+        with self.lock:
+            by_day: Dict[str, List[Dict[str, Any]]] = {}
+            known_undated = self._undated_keys(company)
+            undated = {}
+            now = datetime.now(timezone.utc).isoformat()
+            for article in articles:
+                if article["published"] is None:
+                    undated_key = article.get("link") or article["title"]
+                    if undated_key in known_undated or undated_key in undated:
+                        continue
+                    article = {**article, "published": now}
+                    undated[undated_key] = article
+                key = (company, article["title"], article["published"])
+                if key in self.seen:
+                    continue
+                self.seen[key] = True
+                if len(self.seen) > self.seen_limit:
+                    self.seen.popitem(last=False)
+                by_day.setdefault(article["published"][:10], []).append(article)
+
+            for day, day_articles in by_day.items():
+                try:
+                    fresh.extend(self._merge_day(company, day, day_articles))
+                except Exception as e:
+                    print(f"History Store Append Error: {e}")
+
+            # Remember undated articles only once their rows are stored
+            recorded = {id(article) for article in fresh}
+            self._record_undated(company, [
+                (undated_key, article["published"])
+                for undated_key, article in undated.items()
+                if id(article) in recorded
+            ])
+        return fresh
+
+    def _company_dir(self, company: str) -> str:
+        """
+        Args:
+            company (str): Normalized company name.
+
+        Returns:
+            str: Directory holding the company's day partitions.
+        """
+        return os.path.join(self.root, f"company={quote(company, safe='')}")
+
+    def _undated_keys(self, company: str) -> Dict[str, str]:
+        """
+        Load (once) the keys of a company's undated articles.
+
+        Args:
+            company (str): Normalized company name.
+
+        Returns:
+            dict: Link or title to the time the article was first seen.
+        """
+        if company not in self.undated:
+            keys = {}
+            path = os.path.join(self._company_dir(company), UNDATED_LOG)
+            try:
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as log_file:
+                        for line in log_file:
+                            try:
+                                key, published = json.loads(line)
+                            except ValueError:
+                                # Torn last line from an interrupted append
+                                continue
+                            keys[key] = published
+            except Exception as e:
+                print(f"History Store Undated Log Error: {e}")
+            self.undated[company] = keys
+        return self.undated[company]
+
+    def _record_undated(self, company: str, entries: List[tuple]) -> None:
+        """
+        Append newly stored undated articles to the company's log.
+
+        Args:
+            company (str): Normalized company name.
+            entries (list): (link or title, first-seen time) pairs.
+        """
+        if not entries:
+            return
+        self.undated[company].update(entries)
+        try:
+            with open(os.path.join(self._company_dir(company), UNDATED_LOG), "a", encoding="utf-8") as log_file:
+                for entry in entries:
+                    log_file.write(json.dumps(list(entry)) + "\n")
+        except Exception as e:
+            print(f"History Store Undated Log Error: {e}")
+
+    def _merge_day(
+        self,
+        company: str,
+        day: str,
+        articles: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge articles into a (company, day) partition as one Parquet file.
+
+        Rows already in the partition (same title and timestamp) are
+        skipped. The merged file replaces the old one atomically, and any
+        other files left in the partition are folded in and removed.
+
+        Args:
+            company (str): Normalized company name.
+            day (str): Partition day (YYYY-MM-DD).
+            articles (list): Analyzed articles published on that day.
+
+        Returns:
+            list: The articles that were not yet stored.
+        """
+        partition_dir = os.path.join(self._company_dir(company), f"day={day}")
+        os.makedirs(partition_dir, exist_ok=True)
+        files = sorted(
+            name for name in os.listdir(partition_dir)
+            if name.endswith(".parquet") and not name.startswith(".")
+        )
+        stored = pa.concat_tables(
+            [HISTORY_SCHEMA.empty_table()]
+            + [pq.read_table(os.path.join(partition_dir, name), schema=HISTORY_SCHEMA) for name in files]
+        )
+
+        # Keep the first copy of each stored row, then add unseen articles
+        keys = set()
+        keep = []
+        for title, millis in zip(
+            stored["title"].to_pylist(),
+            pc.cast(stored["timestamp"], pa.int64()).to_pylist()
+        ):
+            keep.append((title, millis) not in keys)
+            keys.add((title, millis))
+        fresh = []
+        for article in articles:
+            published = datetime.fromisoformat(article["published"])
+            key = (article["title"], int(published.timestamp() * 1000))
+            if key not in keys:
+                keys.add(key)
+                fresh.append(article)
+        if not fresh and len(files) <= 1 and all(keep):
+            return []
+
+        table = pa.concat_tables([
+            stored.filter(pa.array(keep, type=pa.bool_())),
+            pa.Table.from_pydict({
+                "timestamp": [datetime.fromisoformat(a["published"]) for a in fresh],
+                "title": [a["title"] for a in fresh],
+                "compound": [a["sentiment_score"] for a in fresh],
+                "label": [a["sentiment"] for a in fresh],
+                "topics": [a["topics"] for a in fresh],
+            }, schema=HISTORY_SCHEMA)
+        ])
+
+        # Dot-prefixed temp files are ignored by dataset discovery
+        tmp_path = os.path.join(partition_dir, f".{uuid.uuid4().hex}.parquet.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, os.path.join(partition_dir, PARTITION_FILE))
+        for name in files:
+            if name != PARTITION_FILE:
+                os.remove(os.path.join(partition_dir, name))
+        return fresh
+
+    def query(
+        self,
+        company: str,
+        start: datetime,
+        end: datetime,
+        bucket: str = "day"
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate stored sentiment for a company per time bucket.
+
+        Only the company's `day=` directories inside the range are
+        scanned, so the cost does not grow with other companies or days.
+
+        Args:
+            company (str): Normalized company name.
+            start (datetime): Inclusive lower bound (UTC).
+            end (datetime): Inclusive upper bound (UTC).
+            bucket (str): One of hour/day/week/month.
+
+        Returns:
+            list: One aggregate dict per non-empty bucket, oldest first.
+        """
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unsupported bucket: {bucket}")
+        table = self._scan(company, start, end)
+        if table.num_rows == 0:
+            return []
+
+        labels = table["label"]
+        table = table.append_column(
+            "bucket",
+            pc.floor_temporal(table["timestamp"], unit=bucket)
+        )
+        for label in ("Positive", "Neutral", "Negative"):
+            table = table.append_column(
+                label, pc.cast(pc.equal(labels, label), pa.int64())
+            )
+
+        grouped = table.group_by("bucket").aggregate([
+            ("compound", "mean"),
+            ("compound", "stddev"),
+            ("compound", "min"),
+            ("compound", "max"),
+            ("compound", "count"),
+            ("Positive", "sum"),
+            ("Neutral", "sum"),
+            ("Negative", "sum"),
+        ]).sort_by("bucket")
+
+        return [
+            {
+                "bucket_start": row["bucket"].isoformat(),
+                "articles": row["compound_count"],
+                "mean_compound": row["compound_mean"],
+                "stddev_compound": row["compound_stddev"],
+                "min_compound": row["compound_min"],
+                "max_compound": row["compound_max"],
+                "sentiment_distribution": {
+                    "Positive": row["Positive_sum"],
+                    "Neutral": row["Neutral_sum"],
+                    "Negative": row["Negative_sum"]
+                }
+            }
+            for row in grouped.to_pylist()
+        ]
+
+    def scores(self, company: str, start: datetime, end: datetime) -> List[Tuple[float, float, str]]:
+        """
+        Return a company's stored scores in a time range, oldest first.
+
+        Args:
+            company (str): Normalized company name.
+            start (datetime): Inclusive lower bound (UTC).
+            end (datetime): Inclusive upper bound (UTC).
+
+        Returns:
+            list: (epoch seconds, compound score, label) per stored article.
+        """
+        table = self._scan(company, start, end).sort_by("timestamp")
+        return [
+            (timestamp.timestamp(), compound, label)
+            for timestamp, compound, label in zip(
+                table["timestamp"].to_pylist(),
+                table["compound"].to_pylist(),
+                table["label"].to_pylist()
+            )
+        ]
+
+    def _scan(self, company: str, start: datetime, end: datetime) -> pa.Table:
+        """
+        Read a company's timestamp, compound and label columns in a range.
+
+        Only the company's `day=` directories inside the range are listed,
+        and the timestamp filter is pushed down to the Parquet scan.
+
+        Args:
+            company (str): Normalized company name.
+            start (datetime): Inclusive lower bound (UTC).
+            end (datetime): Inclusive upper bound (UTC).
+
+        Returns:
+            pa.Table: Matching rows (possibly empty).
+        """
+        company_dir = self._company_dir(company)
+        if not os.path.isdir(company_dir):
+            return HISTORY_SCHEMA.empty_table().select(["timestamp", "compound", "label"])
+
+        first_day, last_day = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+        files = [
+            os.path.join(company_dir, day_dir, name)
+            for day_dir in sorted(os.listdir(company_dir))
+            if day_dir.startswith("day=") and first_day <= day_dir[4:] <= last_day
+            for name in sorted(os.listdir(os.path.join(company_dir, day_dir)))
+            if name.endswith(".parquet") and not name.startswith(".")
+        ]
+        if not files:
+            return HISTORY_SCHEMA.empty_table().select(["timestamp", "compound", "label"])
+
+        dataset = ds.dataset(
+            files,
+            schema=HISTORY_SCHEMA,
+            format="parquet",
+            filesystem=self.filesystem
+        )
+        ts_type = HISTORY_SCHEMA.field("timestamp").type
+        predicate = (
+            (ds.field("timestamp") >= pa.scalar(start, type=ts_type))
+            & (ds.field("timestamp") <= pa.scalar(end, type=ts_type))
+        )
+        return dataset.to_table(columns=["timestamp", "compound", "label"], filter=predicate)
+
+
+def parse_published(value: Optional[str]) -> datetime:
+    """
+    Parse an RSS publication date, falling back to the current time.
+
+    Args:
+        value (str): RFC 822 or ISO 8601 date string.
+
+    Returns:
+        datetime: Timezone-aware UTC timestamp.
+    """
+    if value:
+        for parser in (parsedate_to_datetime, datetime.fromisoformat):
+            try:
+                parsed = parser(value)
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                return parsed.astimezone(timezone.utc)
+            except (TypeError, ValueError):
+                continue
+    return datetime.now(timezone.utc)
@@ -0,0 +1,211 @@
+"""Asynchronous Job Subsystem for News Sentiment Analysis Project."""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from admission import Overloaded
+from metrics import Histogram
+
+
+class JobManager:
+    """
+    Bounded background worker pool for slow report and audio generation.
+
+    Submitting a job returns immediately; results are kept for a TTL
+    after completion. Submitting a spec identical to a queued, running
+    or still-retained successful job returns that job instead of
+    enqueuing new work.
+    """
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]],
+        workers: int = 2,
+        max_queue: int = 100,
+        result_ttl: float = 900.0
+    ):
+        """
+        Configure the pool.
+
+        Args:
+            handlers (dict): Job type to coroutine taking the job params.
+            workers (int): Number of concurrent worker tasks.
+            max_queue (int): Maximum queued (not yet running) jobs.
+            result_ttl (float): Seconds finished jobs are retained.
+        """
+        self.handlers = handlers
+        self.workers = workers
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.by_spec: Dict[str, str] = {}
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker_tasks = []
+        self.durations = Histogram()
+        self.counters = {"submitted": 0, "deduplicated": 0, "succeeded": 0, "failed": 0, "rejected": 0}
+
+    def start(self) -> None:
+        """
+        Start the worker tasks on the running event loop, once.
+        """
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.max_queue)
+            loop = asyncio.get_running_loop()
+            self.worker_tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    @staticmethod
+    def spec_key(job_type: str, params: Dict[str, Any]) -> str:
+        """
+        Hash a job spec for deduplication.
+
+        Args:
+            job_type (str): Job type.
+            params (dict): Job parameters.
+
+        Returns:
+            str: Stable hex digest of the spec.
+        """
+        spec = json.dumps({"type": job_type, "params": params}, sort_keys=True)
+        return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
+    def _expire(self) -> None:
+        """
+        Drop finished jobs whose retention period has passed.
+        """
+        now = time.monotonic()
+        for job_id, job in list(self.jobs.items()):
+            if job["expires_at"] is not None and job["expires_at"] <= now:
+                del self.jobs[job_id]
+                if self.by_spec.get(job["spec_key"]) == job_id:
+                    del self.by_spec[job["spec_key"]]
+
+    def submit(self, job_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enqueue a job, or return an identical live one.
+
+        Args:
+            job_type (str): One of the registered handler names.
+            params (dict): JSON-serializable job parameters.
+
+        Returns:
+            dict: Public view of the job.
+
+        Raises:
+            ValueError: If the job type is unknown.
+            Overloaded: If the queue is full.
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        self.start()
+        self._expire()
+
+        key = self.spec_key(job_type, params)
+        existing = self.jobs.get(self.by_spec.get(key, ""))
+        if existing is not None and existing["status"] != "failed":
+            self.counters["deduplicated"] += 1
+            return self.view(existing)
+
+        if self.queue.full():
+            self.counters["rejected"] += 1
+            raise Overloaded("jobs", 429, 5, "Job queue is full")
+
+        job = {
+            "id": uuid.uuid4().hex,
+            "type": job_type,
+            "params": params,
+            "spec_key": key,
+            "status": "queued",
+            "result": None,
+            "error": None,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "expires_at": None
+        }
+        self.jobs[job["id"]] = job
+        self.by_spec[key] = job["id"]
+        self.queue.put_nowait(job["id"])
+        self.counters["submitted"] += 1
+        return self.view(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job.
+
+        Args:
+            job_id (str): Job identifier.
+
+        Returns:
+            dict: Public view of the job, or None if unknown or expired.
+        """
+        self._expire()
+        job = self.jobs.get(job_id)
+        return self.view(job) if job is not None else None
+
+    @staticmethod
+    def view(job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Strip internal fields from a job record.
+
+        Args:
+            job (dict): Job record.
+
+        Returns:
+            dict: Client-facing job representation.
+        """
+        return {
+            key: value for key, value in job.items()
+            if key not in ("spec_key", "expires_at")
+        }
+
+    async def _worker(self) -> None:
+        """
+        Run queued jobs forever.
+        """
+        while True:
+            job_id = await self.queue.get()
+            job = self.jobs.get(job_id)
+            if job is None:
+                self.queue.task_done()
+                continue
+
+            job["status"] = "running"
+            job["started_at"] = time.time()
+            started = time.monotonic()
+            try:
+                job["result"] = await self.handlers[job["type"]](job["params"])
+                job["status"] = "succeeded"
+                self.counters["succeeded"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                job["error"] = str(e)
+                job["status"] = "failed"
+                self.counters["failed"] += 1
+                print(f"Job Error ({job['type']} {job_id}): {e}")
+            finally:
+                job["finished_at"] = time.time()
+                job["expires_at"] = time.monotonic() + self.result_ttl
+                self.durations.observe((time.monotonic() - started) * 1000)
+                self.queue.task_done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Summarize job activity.
+
+        Returns:
+            dict: Counters, current queue/running counts and durations.
+        """
+        statuses: Dict[str, int] = {}
+        for job in self.jobs.values():
+            statuses[job["status"]] = statuses.get(job["status"], 0) + 1
+        return {
+            **self.counters,
+            "workers": self.workers,
+            "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+            "retained": statuses,
+            "duration_ms": self.durations.snapshot()
+        }
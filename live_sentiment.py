@@ -0,0 +1,215 @@
+"""Streaming, Time-Decayed Sentiment Aggregates for News Sentiment Analysis Project."""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+LABELS = ("Positive", "Neutral", "Negative")
+
+
+class DecayedSentimentAggregate:
+    """
+    Exponentially time-decayed sums of compound scores for one company.
+
+    Two decay rates are tracked: the slow one drives the reported mean,
+    variance and label shares; the fast one is only used for momentum.
+    Every update and snapshot is O(1).
+    """
+    def __init__(self, half_life: float, fast_half_life: float):
+        """
+        Initialize empty decayed sums.
+
+        Args:
+            half_life (float): Half-life of the main aggregate, in seconds.
+            fast_half_life (float): Half-life of the momentum aggregate, in seconds.
+        """
+        self.rate = math.log(2) / half_life
+        self.fast_rate = math.log(2) / fast_half_life
+        self.reference_time: Optional[float] = None
+        self.weight = 0.0
+        self.score_sum = 0.0
+        self.square_sum = 0.0
+        self.label_weights = {label: 0.0 for label in LABELS}
+        self.fast_weight = 0.0
+        self.fast_score_sum = 0.0
+        self.total_updates = 0
+
+    def _advance(self, timestamp: float) -> None:
+        """
+        Decay all sums forward to a later reference time.
+
+        Args:
+            timestamp (float): New reference time (epoch seconds).
+        """
+        elapsed = timestamp - self.reference_time
+        decay = math.exp(-self.rate * elapsed)
+        fast_decay = math.exp(-self.fast_rate * elapsed)
+        self.weight *= decay
+        self.score_sum *= decay
+        self.square_sum *= decay
+        for label in LABELS:
+            self.label_weights[label] *= decay
+        self.fast_weight *= fast_decay
+        self.fast_score_sum *= fast_decay
+        self.reference_time = timestamp
+
+    def update(self, score: float, label: str, timestamp: float) -> None:
+        """
+        Fold one article into the decayed sums.
+
+        Articles older than the current reference time are down-weighted
+        instead of rewinding the state, so out-of-order arrivals stay O(1).
+
+        Args:
+            score (float): Compound sentiment score.
+            label (str): Sentiment label.
+            timestamp (float): Article publication time (epoch seconds).
+        """
+        if self.reference_time is None:
+            self.reference_time = timestamp
+        if timestamp >= self.reference_time:
+            self._advance(timestamp)
+            weight, fast_weight = 1.0, 1.0
+        else:
+            age = self.reference_time - timestamp
+            weight = math.exp(-self.rate * age)
+            fast_weight = math.exp(-self.fast_rate * age)
+
+        self.weight += weight
+        self.score_sum += weight * score
+        self.square_sum += weight * score * score
+        self.label_weights[label] = self.label_weights.get(label, 0.0) + weight
+        self.fast_weight += fast_weight
+        self.fast_score_sum += fast_weight * score
+        self.total_updates += 1
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        """
+        Report the current decayed statistics without mutating state.
+
+        Args:
+            now (float): Evaluation time (epoch seconds).
+
+        Returns:
+            dict: Decayed mean, variance, momentum and label shares.
+        """
+        elapsed = max(now - self.reference_time, 0.0)
+        decay = math.exp(-self.rate * elapsed)
+        weight = self.weight * decay
+
+        mean = self.score_sum / self.weight if self.weight else 0.0
+        variance = self.square_sum / self.weight - mean * mean if self.weight else 0.0
+        fast_mean = self.fast_score_sum / self.fast_weight if self.fast_weight else mean
+        label_total = sum(self.label_weights.values())
+
+        return {
+            "mean": mean,
+            "variance": max(variance, 0.0),
+            "momentum": fast_mean - mean,
+            "effective_articles": weight,
+            "total_articles": self.total_updates,
+            "label_shares": {
+                label: (w / label_total if label_total else 0.0)
+                for label, w in self.label_weights.items()
+            },
+            "last_article_at": self.reference_time
+        }
+
+
+class LiveSentimentTracker:
+    """
+    Registry of per-company decayed sentiment aggregates.
+
+    Aggregates live in memory. The first time a company is used, its
+    aggregate is seeded by replaying the last few half-lives of stored
+    articles, so a restart does not reset it to the next new article.
+    """
+    def __init__(
+        self,
+        half_life: float = 6 * 3600,
+        fast_half_life: float = 3600,
+        history: Optional[Callable[[str, float], List[Tuple[float, float, str]]]] = None,
+        replay_half_lives: float = 5
+    ):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            half_life (float): Half-life of the main aggregate, in seconds.
+            fast_half_life (float): Half-life used for momentum, in seconds.
+            history (callable): Returns a company's stored (timestamp, score,
+                label) rows since an epoch time, oldest first.
+            replay_half_lives (float): How many half-lives of history to replay.
+        """
+        self.half_life = half_life
+        self.fast_half_life = fast_half_life
+        self.history = history
+        self.replay_half_lives = replay_half_lives
+        self.aggregates: Dict[str, DecayedSentimentAggregate] = {}
+        self.lock = threading.Lock()
+
+    def _get(self, company: str) -> DecayedSentimentAggregate:
+        """
+        Return a company's aggregate, seeding it from history on first use.
+
+        Args:
+            company (str): Normalized company name.
+
+        Returns:
+            DecayedSentimentAggregate: The company's aggregate.
+        """
+        aggregate = self.aggregates.get(company)
+        if aggregate is None:
+            aggregate = DecayedSentimentAggregate(self.half_life, self.fast_half_life)
+            if self.history is not None:
+                since = time.time() - self.replay_half_lives * self.half_life
+                try:
+                    for timestamp, score, label in self.history(company, since):
+                        aggregate.update(score, label, timestamp)
+                except Exception as e:
+                    print(f"Live Sentiment Seed Error: {e}")
+            self.aggregates[company] = aggregate
+        return aggregate
+
+    def seed(self, company: str) -> None:
+        """
+        Seed a company's aggregate from history if not done yet.
+
+        Call this before storing new articles, so they are not replayed
+        from history and then counted again by `update`.
+
+        Args:
+            company (str): Normalized company name.
+        """
+        with self.lock:
+            self._get(company)
+
+    def update(self, company: str, score: float, label: str, timestamp: float) -> None:
+        """
+        Record one article for a company.
+
+        Args:
+            company (str): Normalized company name.
+            score (float): Compound sentiment score.
+            label (str): Sentiment label.
+            timestamp (float): Article publication time (epoch seconds).
+        """
+        with self.lock:
+            self._get(company).update(score, label, timestamp)
+
+    def snapshot(self, company: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the current decayed statistics for a company.
+
+        Args:
+            company (str): Normalized company name.
+
+        Returns:
+            dict: Aggregate snapshot, or None if nothing was recorded.
+        """
+        with self.lock:
+            aggregate = self._get(company)
+            if aggregate.total_updates == 0:
+                return None
+            return aggregate.snapshot(time.time())
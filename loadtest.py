@@ -0,0 +1,555 @@
+"""
+Offline Load-Testing Harness for the News Sentiment Analysis API.
+
+Starts local stand-ins for the Google News RSS feed, the translator and
+the TTS service, points the API at them, serves the FastAPI router with
+uvicorn and drives it with an open-loop asyncio load generator.
+
+Example:
+    python loadtest.py --rates 1,2,4,8 --duration 30 \\
+        --mix tesla=3,microsoft=1,apple=1 --audio-fraction 0.1 --json report.json
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+from urllib.request import urlopen
+from xml.sax.saxutils import escape
+
+DEFAULT_FEEDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "loadtest_feeds.json")
+
+
+class StandInConfig:
+    """
+    Latency and failure settings for one stand-in service.
+    """
+    def __init__(self, latency_ms: float = 0.0, error_rate: float = 0.0):
+        """
+        Args:
+            latency_ms (float): Mean added latency; actual delay is uniform
+                in [0.5x, 1.5x].
+            error_rate (float): Probability of answering with HTTP 503.
+        """
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+
+    def delay_and_fail(self) -> bool:
+        """
+        Sleep for the configured latency and decide whether to fail.
+
+        Returns:
+            bool: True if the request should fail.
+        """
+        if self.latency_ms:
+            time.sleep(self.latency_ms * random.uniform(0.5, 1.5) / 1000)
+        return random.random() < self.error_rate
+
+
+class StandInServices:
+    """
+    Local HTTP stand-ins for the news feed, translator and TTS service.
+    """
+    def __init__(
+        self,
+        feeds: Dict[str, Any],
+        feed: StandInConfig,
+        translator: StandInConfig,
+        tts: StandInConfig
+    ):
+        """
+        Args:
+            feeds (dict): Company name to either a list of recorded
+                articles or raw RSS XML.
+            feed (StandInConfig): RSS endpoint behaviour.
+            translator (StandInConfig): Translation endpoint behaviour.
+            tts (StandInConfig): TTS endpoint behaviour.
+        """
+        self.feeds = feeds
+        self.configs = {"/rss/search": feed, "/translate": translator, "/tts": tts}
+        self.request_counts = {path: 0 for path in self.configs}
+        self.not_modified_count = 0
+        self.last_modified = format_datetime(datetime.now(timezone.utc), usegmt=True)
+        self.server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Returns:
+            str: Base URL of the running stand-in server.
+        """
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def render_rss(self, company: str) -> str:
+        """
+        Render a company's recorded feed as Google News style RSS.
+
+        Args:
+            company (str): Company query.
+
+        Returns:
+            str: RSS 2.0 document.
+        """
+        recorded = self.feeds.get(company.lower(), [])
+        if isinstance(recorded, str):
+            return recorded
+        items = "".join(
+            "<item>"
+            f"<title>{escape(article['title'])}</title>"
+            f"<link>{escape(article.get('link', ''))}</link>"
+            f"<pubDate>{escape(article.get('published') or format_datetime(datetime.now(timezone.utc)))}</pubDate>"
+            f"<description>{escape(article['summary'])}</description>"
+            "</item>"
+            for article in recorded
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>\"{escape(company)}\" - Google News</title>{items}</channel></rss>"
+        )
+
+    def start(self) -> None:
+        """
+        Start the stand-in server on an ephemeral local port.
+        """
+        services = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                config = services.configs.get(url.path)
+                if config is None:
+                    self.send_error(404)
+                    return
+                services.request_counts[url.path] += 1
+                if config.delay_and_fail():
+                    self.send_error(503, "Injected stand-in failure")
+                    return
+
+                headers = {}
+                if url.path == "/rss/search":
+                    body = services.render_rss(params.get("q", "")).encode("utf-8")
+                    content_type = "application/rss+xml; charset=utf-8"
+                    # Recorded feeds never change, so validators stay fixed
+                    headers["ETag"] = f'"{hashlib.sha1(body).hexdigest()}"'
+                    headers["Last-Modified"] = services.last_modified
+                    if (
+                        self.headers.get("If-None-Match") == headers["ETag"]
+                        or self.headers.get("If-Modified-Since") == services.last_modified
+                    ):
+                        services.not_modified_count += 1
+                        self.send_response(304)
+                        for name, value in headers.items():
+                            self.send_header(name, value)
+                        self.end_headers()
+                        return
+                elif url.path == "/translate":
+                    text = params.get("text", "")
+                    body = json.dumps({"translation": f"[{params.get('target', '')}] {text}"}).encode()
+                    content_type = "application/json"
+                else:
+                    body = os.urandom(max(256, len(params.get("text", "")) * 64))
+                    content_type = "audio/mpeg"
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        """
+        Shut the stand-in server down.
+        """
+        if self.server is not None:
+            self.server.shutdown()
+
+
+def install_stand_ins(services: StandInServices) -> None:
+    """
+    Point the API's feed, translator and TTS clients at the stand-ins.
+
+    The conditional feed fetcher requests the stand-in RSS endpoint; the
+    patched `fetch_news` fallback reads the same endpoint.
+
+    Args:
+        services (StandInServices): Running stand-in services.
+    """
+    import api
+    import utils
+    from feed_fetcher import parse_feed
+
+    base_url = services.base_url
+
+    async def fetch_news(company: str) -> List[Dict[str, str]]:
+        def load():
+            with urlopen(f"{base_url}/rss/search?{urlencode({'q': company})}", timeout=30) as response:
+                return response.read()
+        return parse_feed(await asyncio.to_thread(load))
+
+    class StandInTranslator:
+        def __init__(self, source: str = "auto", target: str = "en"):
+            self.source = source
+            self.target = target
+
+        def translate(self, text: str) -> str:
+            query = urlencode({"text": text, "source": self.source, "target": self.target})
+            with urlopen(f"{base_url}/translate?{query}", timeout=30) as response:
+                return json.loads(response.read())["translation"]
+
+    class StandInTTS:
+        def __init__(self, text: str, lang: str = "en"):
+            self.text = text
+            self.lang = lang
+
+        def write_to_fp(self, fp) -> None:
+            query = urlencode({"text": self.text, "lang": self.lang})
+            with urlopen(f"{base_url}/tts?{query}", timeout=30) as response:
+                fp.write(response.read())
+
+    api.fetch_news = fetch_news
+    api.news_analysis_api.feed_fetcher.url_template = f"{base_url}/rss/search?q={{query}}"
+    utils.GoogleTranslator = StandInTranslator
+    utils.gTTS = StandInTTS
+
+
+def start_api_server(port: int):
+    """
+    Serve the API router with uvicorn in a background thread.
+
+    Args:
+        port (int): Local port to listen on.
+
+    Returns:
+        uvicorn.Server: The running server.
+    """
+    import uvicorn
+    from fastapi import FastAPI
+    import api
+
+    app = FastAPI()
+    app.include_router(api.router)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of pre-sorted values.
+
+    Args:
+        sorted_values (list): Ascending values.
+        fraction (float): Percentile as a fraction.
+
+    Returns:
+        float: Percentile value (0.0 for no data).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+async def run_step(
+    client,
+    base_url: str,
+    rate: float,
+    duration: float,
+    mix: Dict[str, float],
+    audio_fraction: float,
+    audio_text: str
+) -> Dict[str, Any]:
+    """
+    Offer Poisson-distributed load at a fixed rate and measure it.
+
+    Args:
+        client (httpx.AsyncClient): HTTP client.
+        base_url (str): API base URL.
+        rate (float): Offered requests per second.
+        duration (float): Seconds of load generation.
+        mix (dict): Company name to relative request weight.
+        audio_fraction (float): Share of requests sent to /audio.
+        audio_text (str): Text sent to /audio.
+
+    Returns:
+        dict: Throughput, latency percentiles and error statistics.
+    """
+    companies, weights = list(mix), list(mix.values())
+    results = []
+
+    async def one_request():
+        if random.random() < audio_fraction:
+            path, params = "/audio", {"text": audio_text}
+        else:
+            path, params = "/news", {"company": random.choices(companies, weights)[0]}
+        started = time.perf_counter()
+        try:
+            response = await client.get(f"{base_url}{path}", params=params)
+            status = response.status_code
+        except Exception:
+            status = 0
+        results.append((path, status, (time.perf_counter() - started) * 1000))
+
+    tasks = []
+    started = time.perf_counter()
+    next_at = started
+    while next_at - started < duration:
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one_request()))
+        next_at += random.expovariate(rate)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for _, _, latency in results)
+    ok = [r for r in results if 200 <= r[1] < 300]
+    statuses: Dict[str, int] = {}
+    for _, status, _ in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    return {
+        "offered_rps": rate,
+        "requests": len(results),
+        "throughput_rps": len(ok) / elapsed if elapsed else 0.0,
+        "error_rate": 1 - len(ok) / len(results) if results else 0.0,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "status_codes": statuses
+    }
+
+
+def find_saturation(steps: List[Dict[str, Any]], slo_p99_ms: float, max_error_rate: float) -> Dict[str, Any]:
+    """
+    Locate the first offered rate the service could not sustain.
+
+    A step is saturated when goodput falls below 90% of the offered rate,
+    p99 exceeds the SLO or the error rate exceeds its limit.
+
+    Args:
+        steps (list): Step results in increasing rate order.
+        slo_p99_ms (float): p99 latency objective.
+        max_error_rate (float): Tolerated error rate.
+
+    Returns:
+        dict: Last sustained rate, first saturated rate and the reason.
+    """
+    sustained = None
+    for step in steps:
+        reasons = []
+        if step["throughput_rps"] < 0.9 * step["offered_rps"]:
+            reasons.append("throughput below 90% of offered load")
+        if step["p99_ms"] > slo_p99_ms:
+            reasons.append(f"p99 above {slo_p99_ms:g} ms")
+        if step["error_rate"] > max_error_rate:
+            reasons.append(f"error rate above {max_error_rate:.0%}")
+        if reasons:
+            return {
+                "max_sustained_rps": sustained,
+                "saturated_at_rps": step["offered_rps"],
+                "reasons": reasons
+            }
+        sustained = step["offered_rps"]
+    return {"max_sustained_rps": sustained, "saturated_at_rps": None, "reasons": []}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Render a report as a plain-text table.
+
+    Args:
+        report (dict): Harness report.
+
+    Returns:
+        str: Human-readable summary.
+    """
+    lines = [
+        f"{'offered':>8} {'reqs':>6} {'goodput':>8} {'err%':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  status codes"
+    ]
+    for step in report["steps"]:
+        lines.append(
+            f"{step['offered_rps']:>8g} {step['requests']:>6} {step['throughput_rps']:>8.2f} "
+            f"{step['error_rate'] * 100:>6.1f} {step['p50_ms']:>9.1f} {step['p95_ms']:>9.1f} "
+            f"{step['p99_ms']:>9.1f}  {step['status_codes']}"
+        )
+    saturation = report["saturation"]
+    if saturation["saturated_at_rps"] is None:
+        lines.append(f"No saturation up to {saturation['max_sustained_rps']} rps.")
+    else:
+        lines.append(
+            f"Saturated at {saturation['saturated_at_rps']} rps "
+            f"(last sustained: {saturation['max_sustained_rps']} rps): "
+            + "; ".join(saturation["reasons"])
+        )
+    return "\n".join(lines)
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse a company mix such as "tesla=3,apple=1".
+
+    Args:
+        value (str): Comma-separated name=weight pairs.
+
+    Returns:
+        dict: Company name to weight.
+    """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip().lower()] = float(weight or 1)
+    return mix
+
+
+def load_feeds(path: str) -> Dict[str, Any]:
+    """
+    Load recorded feeds from a JSON file or a directory of <company>.xml files.
+
+    Args:
+        path (str): Fixture path.
+
+    Returns:
+        dict: Company name to articles or raw RSS.
+    """
+    if os.path.isdir(path):
+        feeds = {}
+        for name in os.listdir(path):
+            if name.endswith(".xml"):
+                with open(os.path.join(path, name), "r", encoding="utf-8") as feed_file:
+                    feeds[name[:-4].lower()] = feed_file.read()
+        return feeds
+    with open(path, "r", encoding="utf-8") as feed_file:
+        return json.load(feed_file)
+
+
+async def run_load(args: argparse.Namespace, base_url: str) -> List[Dict[str, Any]]:
+    """
+    Run every configured rate step against the API.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+        base_url (str): API base URL.
+
+    Returns:
+        list: Step results.
+    """
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.max_connections)
+    steps = []
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        for rate in args.rates:
+            step = await run_step(
+                client, base_url, rate, args.duration,
+                args.mix, args.audio_fraction, args.audio_text
+            )
+            steps.append(step)
+            print(f"  {rate:g} rps done: goodput {step['throughput_rps']:.2f}, p99 {step['p99_ms']:.0f} ms",
+                  file=sys.stderr)
+    return steps
+
+
+def main() -> None:
+    """
+    Command-line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rates", default="1,2,4,8",
+                        type=lambda v: [float(r) for r in v.split(",")], help="Offered rates (rps) to step through")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per rate step")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("tesla=3,microsoft=1,apple=1"),
+                        help="Company mix as name=weight pairs")
+    parser.add_argument("--audio-fraction", type=float, default=0.1, help="Share of requests sent to /audio")
+    parser.add_argument("--audio-text", default="Tesla's recent news coverage is predominantly Negative.")
+    parser.add_argument("--feeds", default=DEFAULT_FEEDS, help="Recorded feeds (JSON file or directory of .xml)")
+    parser.add_argument("--feed-latency-ms", type=float, default=150.0)
+    parser.add_argument("--feed-error-rate", type=float, default=0.0)
+    parser.add_argument("--translate-latency-ms", type=float, default=300.0)
+    parser.add_argument("--translate-error-rate", type=float, default=0.0)
+    parser.add_argument("--tts-latency-ms", type=float, default=800.0)
+    parser.add_argument("--tts-error-rate", type=float, default=0.0)
+    parser.add_argument("--cache-ttl", type=float, default=None,
+                        help="Override the API news cache TTL in seconds (0 disables caching)")
+    parser.add_argument("--slo-p99-ms", type=float, default=5000.0, help="p99 objective used for saturation")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Error rate used for saturation")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Client timeout per request (s)")
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8765, help="Port for the API under test")
+    parser.add_argument("--json", dest="json_path", help="Also write the report as JSON to this path")
+    args = parser.parse_args()
+
+    # Keep load-test state out of the real caches and history
+    scratch = tempfile.mkdtemp(prefix="loadtest-")
+    os.environ.setdefault("HISTORY_DIR", os.path.join(scratch, "history"))
+    os.environ.setdefault("EMBEDDING_CACHE_DIR", os.path.join(scratch, "embeddings"))
+
+    services = StandInServices(
+        load_feeds(args.feeds),
+        feed=StandInConfig(args.feed_latency_ms, args.feed_error_rate),
+        translator=StandInConfig(args.translate_latency_ms, args.translate_error_rate),
+        tts=StandInConfig(args.tts_latency_ms, args.tts_error_rate)
+    )
+    services.start()
+    install_stand_ins(services)
+
+    import api
+    if args.cache_ttl is not None:
+        api.NEWS_CACHE_TTL = args.cache_ttl
+
+    server = start_api_server(args.port)
+    try:
+        steps = asyncio.run(run_load(args, f"http://127.0.0.1:{args.port}"))
+    finally:
+        server.should_exit = True
+        services.stop()
+
+    report = {
+        "config": {
+            "rates": args.rates,
+            "duration_s": args.duration,
+            "mix": args.mix,
+            "audio_fraction": args.audio_fraction,
+            "stand_ins": {
+                "feed": vars(services.configs["/rss/search"]),
+                "translator": vars(services.configs["/translate"]),
+                "tts": vars(services.configs["/tts"])
+            }
+        },
+        "steps": steps,
+        "saturation": find_saturation(steps, args.slo_p99_ms, args.max_error_rate),
+        "stand_in_requests": services.request_counts,
+        "stand_in_feed_not_modified": services.not_modified_count
+    }
+
+    print(format_report(report))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
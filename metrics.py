@@ -0,0 +1,87 @@
+"""Lightweight In-Process Metrics for News Sentiment Analysis Project."""
+
+import bisect
+import threading
+from typing import Dict, Any, List, Optional
+
+LATENCY_BOUNDS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000]
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with approximate percentiles.
+
+    Percentiles report the upper bound of the bucket containing the
+    requested rank, so they never under-state a latency.
+    """
+    def __init__(self, bounds: Optional[List[float]] = None):
+        """
+        Initialize empty buckets.
+
+        Args:
+            bounds (list): Sorted bucket upper bounds; an overflow bucket
+                is added automatically. Defaults to latency bounds in ms.
+        """
+        self.bounds = list(bounds or LATENCY_BOUNDS_MS)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value.
+        """
+        with self.lock:
+            self.counts[bisect.bisect_left(self.bounds, value)] += 1
+            self.total += value
+            self.count += 1
+            self.max = max(self.max, value)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Approximate a percentile from the bucket counts.
+
+        Args:
+            fraction (float): Percentile as a fraction (e.g. 0.99).
+
+        Returns:
+            float: Upper bound of the bucket holding that rank.
+        """
+        with self.lock:
+            if not self.count:
+                return 0.0
+            rank = fraction * self.count
+            seen = 0
+            for index, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= rank:
+                    return self.bounds[index] if index < len(self.bounds) else self.max
+            return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            dict: Count, mean, max, p50/p95/p99 and non-empty buckets.
+        """
+        p50, p95, p99 = (self.percentile(f) for f in (0.5, 0.95, 0.99))
+        with self.lock:
+            labels = [f"le_{bound:g}" for bound in self.bounds] + ["overflow"]
+            return {
+                "count": self.count,
+                "mean": self.total / self.count if self.count else 0.0,
+                "max": self.max,
+                "p50": p50,
+                "p95": p95,
+                "p99": p99,
+                "buckets": {
+                    label: bucket_count
+                    for label, bucket_count in zip(labels, self.counts) if bucket_count
+                }
+            }
@@ -0,0 +1,228 @@
+"""Popularity-Aware Background Prefetching for News Sentiment Analysis Project."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class PrefetchScheduler:
+    """
+    Keeps popular companies' cached reports warm.
+
+    Request counts decay exponentially over time; on every tick the most
+    popular companies whose cache entries are about to expire are
+    refreshed in the background, within a concurrency limit and a
+    token-bucket rate budget. Failing companies back off exponentially.
+    """
+    def __init__(
+        self,
+        refresh: Callable[[str], Awaitable[Any]],
+        expiry_of: Callable[[str], Optional[float]],
+        top_n: int = 10,
+        lead_time: float = 60.0,
+        interval: float = 10.0,
+        max_concurrency: int = 2,
+        refreshes_per_minute: float = 20.0,
+        popularity_half_life: float = 1800.0,
+        base_backoff: float = 30.0,
+        max_backoff: float = 900.0
+    ):
+        """
+        Configure the scheduler.
+
+        Args:
+            refresh (callable): Coroutine that rebuilds a company's cache entry.
+            expiry_of (callable): Returns a company's cache expiry
+                (time.monotonic() based) or None when not cached.
+            top_n (int): Number of most popular companies kept warm.
+            lead_time (float): Seconds before expiry at which to refresh.
+            interval (float): Seconds between scheduling passes.
+            max_concurrency (int): Maximum simultaneous refreshes.
+            refreshes_per_minute (float): Sustained refresh rate budget.
+            popularity_half_life (float): Half-life of request counts, in seconds.
+            base_backoff (float): First retry delay after a failed refresh.
+            max_backoff (float): Upper bound on the retry delay.
+        """
+        self.refresh = refresh
+        self.expiry_of = expiry_of
+        self.top_n = top_n
+        self.lead_time = lead_time
+        self.interval = interval
+        self.max_concurrency = max_concurrency
+        self.refill_rate = refreshes_per_minute / 60.0
+        self.decay_rate = math.log(2) / popularity_half_life
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.popularity: Dict[str, tuple] = {}
+        self.failures: Dict[str, int] = {}
+        self.retry_at: Dict[str, float] = {}
+        self.running: Dict[str, asyncio.Task] = {}
+        self.tokens = float(max_concurrency)
+        self.tokens_updated = time.monotonic()
+        self.history = deque(maxlen=100)
+        self.counters = {"refreshed": 0, "failed": 0, "skipped_rate_limited": 0}
+        self.task: Optional[asyncio.Task] = None
+
+    def record_request(self, company: str) -> None:
+        """
+        Count a foreground request for a company.
+
+        Args:
+            company (str): Normalized company name.
+        """
+        now = time.monotonic()
+        score, updated = self.popularity.get(company, (0.0, now))
+        self.popularity[company] = (self._decayed(score, updated, now) + 1.0, now)
+
+    def _decayed(self, score: float, updated: float, now: float) -> float:
+        """
+        Decay a popularity score to the given time.
+
+        Args:
+            score (float): Score at `updated`.
+            updated (float): Time the score was last updated.
+            now (float): Evaluation time.
+
+        Returns:
+            float: Decayed score.
+        """
+        return score * math.exp(-self.decay_rate * (now - updated))
+
+    def start(self) -> None:
+        """
+        Start the background loop on the running event loop, once.
+        """
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Cancel the background loop and any in-flight refreshes.
+        """
+        for task in [self.task, *self.running.values()]:
+            if task is not None:
+                task.cancel()
+        self.task = None
+
+    async def _run(self) -> None:
+        """
+        Run scheduling passes forever.
+        """
+        while True:
+            try:
+                self._tick()
+            except Exception as e:
+                print(f"Prefetch Scheduling Error: {e}")
+            await asyncio.sleep(self.interval)
+
+    def _take_token(self, now: float) -> bool:
+        """
+        Consume one refresh from the rate budget if available.
+
+        Args:
+            now (float): Current monotonic time.
+
+        Returns:
+            bool: True if a refresh may start.
+        """
+        self.tokens = min(
+            float(self.max_concurrency),
+            self.tokens + (now - self.tokens_updated) * self.refill_rate
+        )
+        self.tokens_updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def _tick(self) -> None:
+        """
+        Start refreshes for the hottest companies that are about to expire.
+        """
+        now = time.monotonic()
+        scores = {}
+        for company, (score, updated) in list(self.popularity.items()):
+            decayed = self._decayed(score, updated, now)
+            if decayed < 0.01:
+                del self.popularity[company]
+            else:
+                scores[company] = decayed
+
+        hottest = sorted(scores, key=scores.get, reverse=True)[:self.top_n]
+        for company in hottest:
+            if len(self.running) >= self.max_concurrency:
+                break
+            expires_at = self.expiry_of(company)
+            if expires_at is None or expires_at - now > self.lead_time:
+                continue
+            if company in self.running or self.retry_at.get(company, 0.0) > now:
+                continue
+            if not self._take_token(now):
+                self.counters["skipped_rate_limited"] += 1
+                break
+            task = asyncio.get_running_loop().create_task(
+                self._refresh_one(company, scores[company])
+            )
+            self.running[company] = task
+
+    async def _refresh_one(self, company: str, popularity: float) -> None:
+        """
+        Refresh one company and record the outcome.
+
+        Args:
+            company (str): Normalized company name.
+            popularity (float): Decayed request count at scheduling time.
+        """
+        started = time.monotonic()
+        error = None
+        try:
+            await self.refresh(company)
+            self.failures.pop(company, None)
+            self.retry_at.pop(company, None)
+            self.counters["refreshed"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = str(e)
+            failures = self.failures.get(company, 0) + 1
+            self.failures[company] = failures
+            delay = min(self.base_backoff * 2 ** (failures - 1), self.max_backoff)
+            self.retry_at[company] = time.monotonic() + delay
+            self.counters["failed"] += 1
+            print(f"Prefetch Refresh Error ({company}): {e}")
+        finally:
+            self.running.pop(company, None)
+
+        self.history.append({
+            "company": company,
+            "popularity": round(popularity, 3),
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+            "ok": error is None,
+            "error": error,
+            "finished_at": time.time()
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Summarize scheduler activity.
+
+        Returns:
+            dict: Counters, in-flight refreshes, backoffs and recent refreshes.
+        """
+        now = time.monotonic()
+        return {
+            **self.counters,
+            "in_flight": sorted(self.running),
+            "backing_off": {
+                company: round(retry_at - now, 1)
+                for company, retry_at in self.retry_at.items() if retry_at > now
+            },
+            "popularity": {
+                company: round(self._decayed(score, updated, now), 3)
+                for company, (score, updated) in self.popularity.items()
+            },
+            "recent_refreshes": list(self.history)
+        }
@@ -1,16 +1,45 @@
 """Utility Functions for News Sentiment Analysis Project."""
 
+import os
+import re
 import base64
 import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from io import BytesIO
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 from deep_translator import GoogleTranslator
 from gtts import gTTS
-from langdetect import detect, LangDetectException
+from langdetect import detect, DetectorFactory, LangDetectException
 from transformers import pipeline
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from keybert import KeyBERT
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from batching import MicroBatcher
+from deadline import Deadline
+from embedding_cache import PhraseEmbeddingCache
+
+KEYWORD_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_CACHE_DIR = os.environ.get("EMBEDDING_CACHE_DIR", ".cache/embeddings")
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.environ.get("EMBEDDING_CACHE_MAX_ENTRIES", "100000"))
+BATCH_MAX_WAIT_MS = float(os.environ.get("BATCH_MAX_WAIT_MS", "5"))
+SUMMARY_BATCH_SIZE = int(os.environ.get("SUMMARY_BATCH_SIZE", "8"))
+ENCODER_BATCH_SIZE = int(os.environ.get("ENCODER_BATCH_SIZE", "64"))
+LANGUAGE_CACHE_SIZE = int(os.environ.get("LANGUAGE_CACHE_SIZE", "20000"))
+TOPIC_CACHE_SIZE = int(os.environ.get("TOPIC_CACHE_SIZE", "5000"))
+SUMMARY_TOKEN_BUDGET = int(os.environ.get("SUMMARY_TOKEN_BUDGET", "8192"))
+CHUNK_SUMMARY_GROUP = (142, 30)
+TRANSLATION_CHUNK_CHARS = 4500
+MARKUP_PATTERN = re.compile(r"<[^>]+>|&\w+;|https?://\S+")
+
+# Make langdetect deterministic so memoized results are stable
+DetectorFactory.seed = 0
 
 
 class SentimentAnalyzer:
@@ -22,8 +51,34 @@ class SentimentAnalyzer:
         Initialize sentiment analysis and text processing tools.
         """
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
-        self.keyword_extractor = KeyBERT()
+        self.keyword_extractor = KeyBERT(model=KEYWORD_MODEL)
+        self.phrase_cache = PhraseEmbeddingCache(
+            EMBEDDING_CACHE_DIR, KEYWORD_MODEL, max_entries=EMBEDDING_CACHE_MAX_ENTRIES
+        )
         self.summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
+        # Leave headroom under bart-large-cnn's 1024-token input window
+        self.summary_chunk_tokens = min(self.summarizer.tokenizer.model_max_length, 1024) - 24
+        self.summary_batcher = MicroBatcher(
+            "summarizer", self._summarize_batch, SUMMARY_BATCH_SIZE, BATCH_MAX_WAIT_MS
+        )
+        self.encoder_batcher = MicroBatcher(
+            "keyword_encoder", self._embed_batch, ENCODER_BATCH_SIZE, BATCH_MAX_WAIT_MS
+        )
+        self.language_cache = OrderedDict()
+        self.language_lock = threading.Lock()
+        self.translation_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="translate")
+        self.topic_cache = OrderedDict()
+        self.topic_lock = threading.Lock()
+        self.language_stats = {
+            "detections": 0,
+            "detection_cache_hits": 0,
+            "articles_scored_as_is": 0,
+            "articles_translated": 0,
+            "articles_translation_failed": 0,
+            "translation_requests": 0,
+            "audio_translations_skipped": 0,
+            "audio_translations": 0
+        }
 
     def analyze_sentiment(self, text: str) -> str:
         """
@@ -35,42 +90,195 @@ class SentimentAnalyzer:
         Returns:
             str: Sentiment classification (Positive/Negative/Neutral).
         """
+        return self.classify_compound(self.polarity_score(text))
+
+    def polarity_score(self, text: str) -> float:
+        """
+        Compute the VADER compound polarity of given text.
+
+        Args:
+            text (str): Input text to score.
+
+        Returns:
+            float: Compound score in [-1, 1] (0.0 on failure).
+        """
         try:
-            score = self.sentiment_analyzer.polarity_scores(text)
-            if score["compound"] >= 0.05:
-                return "Positive"
-            elif score["compound"] <= -0.05:
-                return "Negative"
-            return "Neutral"
+            return self.sentiment_analyzer.polarity_scores(text)["compound"]
         except Exception as e:
             print(f"Sentiment Analysis Error: {e}")
-            return "Neutral"
+            return 0.0
 
-    def extract_keywords(self, text: str, top_n: int = 5) -> List[str]:
+    @staticmethod
+    def classify_compound(compound: float) -> str:
+        """
+        Map a compound score to a sentiment label.
+
+        Args:
+            compound (float): Compound polarity score.
+
+        Returns:
+            str: Sentiment classification (Positive/Negative/Neutral).
+        """
+        if compound >= 0.05:
+            return "Positive"
+        elif compound <= -0.05:
+            return "Negative"
+        return "Neutral"
+
+    def extract_keywords(
+        self,
+        text: str,
+        top_n: int = 5,
+        usage: Optional[Dict[str, int]] = None
+    ) -> List[str]:
         """
         Extract top keywords from text.
 
         Args:
             text (str): Input text to extract keywords from.
             top_n (int): Number of keywords to extract.
+            usage (dict): Optional counter of phrase cache hits/misses.
 
         Returns:
             list: Top keywords/keyphrases.
         """
+        return self.extract_keywords_batch([text], top_n, usage)[0]
+
+    def extract_keywords_batch(
+        self,
+        texts: List[str],
+        top_n: int = 5,
+        usage: Optional[Dict[str, int]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> List[List[str]]:
+        """
+        Extract top keywords from several texts with shared encoder calls.
+
+        Candidate phrase embeddings are served from the shared phrase
+        cache, so only phrases never seen before reach the encoder, and
+        all encoder work goes through the cross-request micro-batcher.
+        When the deadline runs out, texts fall back to previously
+        computed topics (or none).
+
+        Args:
+            texts (list): Input texts to extract keywords from.
+            top_n (int): Number of keywords to extract per text.
+            usage (dict): Optional counter of phrase cache hits/misses.
+            deadline (Deadline): Optional latency budget.
+
+        Returns:
+            list: Top keywords/keyphrases for each text.
+        """
+        deadline = deadline or Deadline()
+        if deadline.expired():
+            return [self._fallback_topics(text, top_n, deadline, i) for i, text in enumerate(texts)]
+
         try:
-            return [kw[0] for kw in self.keyword_extractor.extract_keywords(
-                text,
-                keyphrase_ngram_range=(1, 2),
-                stop_words="english",
-                top_n=top_n
-            )]
+            candidates = []
+            for text in texts:
+                try:
+                    candidates.append(CountVectorizer(
+                        ngram_range=(1, 2),
+                        stop_words="english"
+                    ).fit([text]).get_feature_names_out().tolist())
+                except ValueError:
+                    # Empty vocabulary (e.g. only stop words)
+                    candidates.append([])
+
+            doc_futures = [self.encoder_batcher.submit(text) for text in texts]
+            phrases = list(dict.fromkeys(p for phrase_list in candidates for p in phrase_list))
+            phrase_embeddings = self.phrase_cache.get_or_encode(
+                phrases,
+                lambda missing: np.vstack([
+                    deadline.wait(future)
+                    for future in [self.encoder_batcher.submit(p) for p in missing]
+                ]),
+                usage
+            )
+            rows = {phrase: row for row, phrase in enumerate(phrases)}
+
+            keywords = []
+            for index, (text, phrase_list, doc_future) in enumerate(
+                zip(texts, candidates, doc_futures)
+            ):
+                try:
+                    doc_embedding = deadline.wait(doc_future)
+                except FutureTimeoutError:
+                    keywords.append(self._fallback_topics(text, top_n, deadline, index))
+                    continue
+                if not phrase_list:
+                    keywords.append([])
+                    continue
+                similarities = cosine_similarity(
+                    doc_embedding.reshape(1, -1),
+                    phrase_embeddings[[rows[p] for p in phrase_list]]
+                )[0]
+                ranked = np.argsort(similarities)[::-1][:top_n]
+                keywords.append([phrase_list[i] for i in ranked])
+                self._remember_topics(text, top_n, keywords[-1])
+            return keywords
+        except FutureTimeoutError:
+            return [self._fallback_topics(text, top_n, deadline, i) for i, text in enumerate(texts)]
         except Exception as e:
             print(f"Keyword Extraction Error: {e}")
-            return []
+            return [[] for _ in texts]
+
+    def _remember_topics(self, text: str, top_n: int, topics: List[str]) -> None:
+        """
+        Keep computed topics for budget-exhausted requests to reuse.
+
+        Args:
+            text (str): Source text.
+            top_n (int): Number of keywords requested.
+            topics (list): Extracted keywords.
+        """
+        key = (hashlib.sha1(text.encode("utf-8")).hexdigest(), top_n)
+        with self.topic_lock:
+            self.topic_cache[key] = topics
+            self.topic_cache.move_to_end(key)
+            if len(self.topic_cache) > TOPIC_CACHE_SIZE:
+                self.topic_cache.popitem(last=False)
+
+    def _fallback_topics(
+        self,
+        text: str,
+        top_n: int,
+        deadline: Deadline,
+        index: int
+    ) -> List[str]:
+        """
+        Return previously computed topics, or none, for a degraded text.
+
+        Args:
+            text (str): Source text.
+            top_n (int): Number of keywords requested.
+            deadline (Deadline): Budget recording the degradation.
+            index (int): Position of the text in the request.
+
+        Returns:
+            list: Cached keywords, or an empty list.
+        """
+        deadline.degrade("topics", index)
+        key = (hashlib.sha1(text.encode("utf-8")).hexdigest(), top_n)
+        with self.topic_lock:
+            return list(self.topic_cache.get(key, []))
+
+    def _embed_batch(self, texts: List[str], group: Any = None) -> List[np.ndarray]:
+        """
+        Encode one micro-batch with the keyword embedding model.
+
+        Args:
+            texts (list): Documents or phrases to encode.
+            group: Unused batch group key.
+
+        Returns:
+            list: One embedding vector per text.
+        """
+        return list(self.keyword_extractor.model.embed(texts))
 
     def summarize_text(self, text: str, max_length: int = 50) -> str:
         """
-        Summarize text if longer than specified word count.
+        Summarize text if longer than specified token count.
 
         Args:
             text (str): Input text to summarize.
@@ -79,19 +287,429 @@ class SentimentAnalyzer:
         Returns:
             str: Summarized text or original text.
         """
+        return self.summarize_texts([text], max_length)[0]
+
+    def summarize_texts(
+        self,
+        texts: List[str],
+        max_length: int = 50,
+        deadline: Optional[Deadline] = None,
+        usage: Optional[Dict[str, int]] = None,
+        token_budget: Optional[int] = None
+    ) -> List[str]:
+        """
+        Summarize several texts through the shared summarization batcher.
+
+        Markup and URLs are stripped first, so feed summaries made of HTML
+        anchors are measured and summarized by their visible text. Texts
+        longer than `max_length` words are summarized; their size in
+        summarizer tokens decides the path. Texts that fit the model's
+        input window are summarized directly; longer ones are split on
+        sentence boundaries into fitting chunks, all chunks are summarized
+        as one batch, and the combined chunk summaries are summarized
+        again (map-reduce). At most `token_budget` input tokens are fed to
+        the model per call; content past the cap is dropped. Each chunked
+        document reserves one input window of the budget for its final
+        pass, so it always ends up with a summary of at most `max_length`
+        tokens.
+        The summarizer is English-only, so texts detected as another
+        language are returned unchanged. Texts whose summaries are not
+        ready within the deadline keep their original text.
+
+        Args:
+            texts (list): Input texts to summarize.
+            max_length (int): Maximum summary length, in tokens.
+            deadline (Deadline): Optional latency budget.
+            usage (dict): Optional counter of tokens processed, model inputs,
+                chunks, documents cut short by the token cap and non-English
+                documents skipped.
+            token_budget (int): Input token cap (default SUMMARY_TOKEN_BUDGET).
+
+        Returns:
+            list: Summarized text (or original text) for each input.
+        """
+        deadline = deadline or Deadline()
+        usage = usage if usage is not None else {}
+        budget = {"remaining": token_budget or SUMMARY_TOKEN_BUDGET}
+        final_group = (max_length, min(25, max_length))
+        summaries = list(texts)
+        capped = set()
+
+        plain = [self._strip_markup(text) for text in texts]
+        english = [self.detect_language(text) in ("en", "unknown") for text in texts]
+        usage["skipped_non_english"] = usage.get("skipped_non_english", 0) + english.count(False)
+        needs_summary = [
+            index for index, text in enumerate(plain)
+            if len(text.split()) > max_length and english[index]
+        ]
+        token_counts = dict(zip(
+            needs_summary, self._count_tokens([plain[index] for index in needs_summary])
+        ))
+        if deadline.expired():
+            for index in needs_summary:
+                deadline.degrade("summarization", index)
+            return summaries
+
+        # Short documents go straight to the final pass; long ones are chunked
+        final_futures = {}
+        chunked = {}
+        sizes = {}
+        reserved = {}
+        for index in needs_summary:
+            if token_counts[index] <= self.summary_chunk_tokens:
+                if self._spend_tokens(budget, token_counts[index], usage):
+                    final_futures[index] = self.summary_batcher.submit(plain[index], final_group)
+                else:
+                    capped.add(index)
+                continue
+
+            # Hold back one input window for the document's final pass
+            if budget["remaining"] < 2 * self.summary_chunk_tokens:
+                capped.add(index)
+                continue
+            budget["remaining"] -= self.summary_chunk_tokens
+            chunks, truncated = self._chunk_text(plain[index], budget, usage)
+            if truncated:
+                capped.add(index)
+            if chunks:
+                chunked[index] = chunks
+                sizes[index] = token_counts[index]
+                reserved[index] = self.summary_chunk_tokens
+            else:
+                budget["remaining"] += self.summary_chunk_tokens
+
+        # Map: summarize the chunks of every long document in shared batches,
+        # re-chunking combined summaries that still exceed the input window
+        while chunked:
+            chunk_futures = {
+                index: [self.summary_batcher.submit(chunk, CHUNK_SUMMARY_GROUP) for chunk in chunks]
+                for index, chunks in chunked.items()
+            }
+            chunked = {}
+            for index, futures in chunk_futures.items():
+                try:
+                    combined = " ".join(deadline.wait(future) for future in futures)
+                except FutureTimeoutError:
+                    deadline.degrade("summarization", index)
+                    budget["remaining"] += reserved.pop(index)
+                    continue
+                except Exception as e:
+                    print(f"Text Summarization Error: {e}")
+                    budget["remaining"] += reserved.pop(index)
+                    continue
+
+                # Re-chunk only while each round shrinks the text and the
+                # budget allows; otherwise the final pass truncates it
+                combined_tokens = self._count_tokens([combined])[0]
+                if self.summary_chunk_tokens < combined_tokens < sizes[index]:
+                    sizes[index] = combined_tokens
+                    chunks, truncated = self._chunk_text(combined, budget, usage)
+                    if truncated:
+                        capped.add(index)
+                    if chunks:
+                        chunked[index] = chunks
+                        continue
+
+                # The reserved window always covers the final pass
+                budget["remaining"] += reserved.pop(index)
+                self._spend_tokens(budget, min(combined_tokens, self.summary_chunk_tokens), usage)
+                final_futures[index] = self.summary_batcher.submit(combined, final_group)
+
+        # Reduce: final summaries for short documents and combined chunk summaries
+        for index, future in final_futures.items():
+            try:
+                summaries[index] = deadline.wait(future)
+            except FutureTimeoutError:
+                deadline.degrade("summarization", index)
+            except Exception as e:
+                print(f"Text Summarization Error: {e}")
+        usage["capped_documents"] = usage.get("capped_documents", 0) + len(capped)
+        return summaries
+
+    @staticmethod
+    def _strip_markup(text: str) -> str:
+        """
+        Replace HTML tags, entities and URLs with spaces.
+
+        Args:
+            text (str): Input text, possibly an HTML feed snippet.
+
+        Returns:
+            str: Visible text.
+        """
+        return " ".join(MARKUP_PATTERN.sub(" ", text).split())
+
+    def _count_tokens(self, texts: List[str], special_tokens: bool = True) -> List[int]:
+        """
+        Count summarizer tokens for each text.
+
+        Args:
+            texts (list): Texts to measure.
+            special_tokens (bool): Include BOS/EOS tokens in the count.
+
+        Returns:
+            list: Token count per text.
+        """
+        if not texts:
+            return []
+        encoded = self.summarizer.tokenizer(list(texts), add_special_tokens=special_tokens)
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    @staticmethod
+    def _spend_tokens(budget: Dict[str, int], tokens: int, usage: Dict[str, int]) -> bool:
+        """
+        Reserve model input tokens from the per-call budget.
+
+        Args:
+            budget (dict): Mutable {"remaining": int} budget.
+            tokens (int): Tokens about to be fed to the model.
+            usage (dict): Counter updated on success.
+
+        Returns:
+            bool: True if the tokens fit in the budget.
+        """
+        if tokens > budget["remaining"]:
+            return False
+        budget["remaining"] -= tokens
+        usage["tokens_processed"] = usage.get("tokens_processed", 0) + tokens
+        usage["model_inputs"] = usage.get("model_inputs", 0) + 1
+        return True
+
+    def _chunk_text(
+        self,
+        text: str,
+        budget: Dict[str, int],
+        usage: Dict[str, int]
+    ) -> Tuple[List[str], bool]:
+        """
+        Split text on sentence boundaries into chunks that fit the model.
+
+        Sentences longer than a chunk are split into token windows.
+        Chunks are kept in order until the token budget runs out.
+
+        Args:
+            text (str): Long input text.
+            budget (dict): Mutable {"remaining": int} budget.
+            usage (dict): Counter of tokens processed and chunks.
+
+        Returns:
+            tuple: Chunks within budget, and whether any were dropped.
+        """
+        limit = self.summary_chunk_tokens
+        tokenizer = self.summarizer.tokenizer
+        sentences = [s for s in re.split(r"(?<=[.!?])\s+", text.strip()) if s]
+
+        pieces = []
+        for sentence, count in zip(sentences, self._count_tokens(sentences, special_tokens=False)):
+            if count <= limit:
+                pieces.append((sentence, count))
+                continue
+            ids = tokenizer.encode(sentence, add_special_tokens=False)
+            for start in range(0, len(ids), limit):
+                window = ids[start:start + limit]
+                pieces.append((tokenizer.decode(window), len(window)))
+
+        chunks, current, size = [], [], 0
+        for piece, count in pieces:
+            if current and size + count > limit:
+                chunks.append((" ".join(current), size))
+                current, size = [], 0
+            current.append(piece)
+            size += count
+        if current:
+            chunks.append((" ".join(current), size))
+
+        kept = []
+        for chunk, count in chunks:
+            # Two extra tokens for BOS/EOS
+            if not self._spend_tokens(budget, count + 2, usage):
+                break
+            kept.append(chunk)
+        usage["chunks"] = usage.get("chunks", 0) + len(kept)
+        return kept, len(kept) < len(chunks)
+
+    def _summarize_batch(self, texts: List[str], group: tuple) -> List[str]:
+        """
+        Run one micro-batch through the summarization model.
+
+        Args:
+            texts (list): Texts sharing the same length limits.
+            group (tuple): (max_length, min_length) for generation.
+
+        Returns:
+            list: One summary per text.
+        """
+        max_length, min_length = group
+        outputs = self.summarizer(
+            texts,
+            max_length=max_length,
+            min_length=min_length,
+            do_sample=False,
+            truncation=True
+        )
+        return [output["summary_text"] for output in outputs]
+
+    def detect_language(self, text: str) -> str:
+        """
+        Detect the language of text, memoized by text hash.
+
+        Markup is stripped and only the first 1000 characters are
+        inspected, which is enough for langdetect and keeps it cheap.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            str: ISO 639-1 language code, or "unknown".
+        """
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        with self.language_lock:
+            self.language_stats["detections"] += 1
+            if key in self.language_cache:
+                self.language_cache.move_to_end(key)
+                self.language_stats["detection_cache_hits"] += 1
+                return self.language_cache[key]
+
+        plain = self._strip_markup(text)[:1000]
         try:
-            if len(text.split()) > max_length:
-                summary = self.summarizer(
-                    text,
-                    max_length=max_length,
-                    min_length=25,
-                    do_sample=False
-                )[0]["summary_text"]
-                return summary
-            return text
-        except Exception as e:
-            print(f"Text Summarization Error: {e}")
-            return text
+            language = detect(plain).split("-")[0].lower()
+        except LangDetectException:
+            language = "unknown"
+
+        with self.language_lock:
+            self.language_cache[key] = language
+            if len(self.language_cache) > LANGUAGE_CACHE_SIZE:
+                self.language_cache.popitem(last=False)
+        return language
+
+    def route_for_scoring(
+        self,
+        texts: List[str],
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Return English versions of texts for the English-only models.
+
+        English (or undetectable) texts pass through untouched; the rest
+        are grouped by language and translated in batched requests. Texts
+        whose translation fails or misses the deadline are scored as they
+        are and counted as failed translations.
+
+        Args:
+            texts (list): Article texts.
+            deadline (Deadline): Optional latency budget.
+
+        Returns:
+            tuple: Texts to score and detected languages, aligned with the input.
+        """
+        routed = list(texts)
+        languages = [self.detect_language(text) for text in texts]
+        by_language: Dict[str, List[int]] = {}
+        for index, language in enumerate(languages):
+            if language not in ("en", "unknown"):
+                by_language.setdefault(language, []).append(index)
+
+        skipped = len(texts) - sum(len(indices) for indices in by_language.values())
+        translated = 0
+
+        deadline = deadline or Deadline()
+        pending = {}
+        for language, indices in by_language.items():
+            if deadline.expired():
+                for index in indices:
+                    deadline.degrade("translation", index)
+                continue
+            pending[language] = self.translation_pool.submit(
+                self._translate_batch, [texts[i] for i in indices], "en"
+            )
+
+        for language, future in pending.items():
+            indices = by_language[language]
+            try:
+                translations = deadline.wait(future)
+            except FutureTimeoutError:
+                for index in indices:
+                    deadline.degrade("translation", index)
+                continue
+            for index, translation in zip(indices, translations):
+                if translation is not None:
+                    routed[index] = translation
+                    translated += 1
+
+        # Count only translations that actually completed
+        with self.language_lock:
+            self.language_stats["articles_scored_as_is"] += skipped
+            self.language_stats["articles_translated"] += translated
+            self.language_stats["articles_translation_failed"] += len(texts) - skipped - translated
+        return routed, languages
+
+    def _translate_batch(self, texts: List[str], target_lang: str = "en") -> List[str]:
+        """
+        Translate texts of one language with as few requests as possible.
+
+        Texts are flattened to single lines and joined into chunks under
+        the translator's size limit; if a chunk does not come back with
+        the same number of lines it is retried item by item.
+
+        Args:
+            texts (list): Texts sharing a source language.
+            target_lang (str): Target language code.
+
+        Returns:
+            list: Translated texts, with None where translation failed.
+        """
+        translator = GoogleTranslator(source="auto", target=target_lang)
+        lines = [" ".join(text.split()) for text in texts]
+        chunks, current, size = [], [], 0
+        for index, line in enumerate(lines):
+            if current and size + len(line) + 1 > TRANSLATION_CHUNK_CHARS:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(index)
+            size += len(line) + 1
+        if current:
+            chunks.append(current)
+
+        results: List[Optional[str]] = [None] * len(texts)
+        for chunk in chunks:
+            try:
+                with self.language_lock:
+                    self.language_stats["translation_requests"] += 1
+                translated = translator.translate("\n".join(lines[i] for i in chunk))
+                parts = translated.split("\n") if translated else []
+                if len(parts) != len(chunk):
+                    parts = [translator.translate(lines[i]) for i in chunk]
+                for index, part in zip(chunk, parts):
+                    results[index] = part or None
+            except Exception as e:
+                print(f"Batch Translation Error: {e}")
+        return results
+
+    def get_language_stats(self) -> Dict[str, Any]:
+        """
+        Summarize language routing activity.
+
+        Returns:
+            dict: Counters plus detection-cache and skip rates.
+        """
+        with self.language_lock:
+            stats = dict(self.language_stats)
+        articles = (
+            stats["articles_scored_as_is"]
+            + stats["articles_translated"]
+            + stats["articles_translation_failed"]
+        )
+        audio = stats["audio_translations_skipped"] + stats["audio_translations"]
+        stats["detection_cache_hit_rate"] = (
+            stats["detection_cache_hits"] / stats["detections"] if stats["detections"] else 0.0
+        )
+        stats["article_translation_skip_rate"] = (
+            stats["articles_scored_as_is"] / articles if articles else 0.0
+        )
+        stats["audio_translation_skip_rate"] = (
+            stats["audio_translations_skipped"] / audio if audio else 0.0
+        )
+        return stats
 
     async def generate_multilingual_audio(
         self, 
@@ -111,13 +729,26 @@ class SentimentAnalyzer:
             dict: Audio details with base64 encoding.
         """
         try:
-            # Translate text
-            translated_text = await self._translate_text(text, source_lang, target_lang)
+            # Translate text unless it is already in the target language
+            target = target_lang.split("-")[0].lower()
+            if (
+                source_lang.split("-")[0].lower() == target
+                or await asyncio.to_thread(self.detect_language, text) == target
+            ):
+                with self.language_lock:
+                    self.language_stats["audio_translations_skipped"] += 1
+                translated_text = text
+                tts_language = target_lang
+            else:
+                with self.language_lock:
+                    self.language_stats["audio_translations"] += 1
+                translated_text = await self._translate_text(text, source_lang, target_lang)
+                tts_language = target_lang if translated_text != text else source_lang
 
             # Generate audio
             audio_base64 = await self._text_to_speech(
                 translated_text, 
-                language=target_lang if translated_text != text else source_lang
+                language=tts_language
             )
 
             return {